@@ -52,6 +52,8 @@ export default function AdminLoginForm() {
         } else {
           setError('Login failed. Please check your credentials.');
         }
+      } else if (err.response?.status === 429) {
+        setError('Too many login attempts. Please try again later.');
       } else {
         setError('Login failed. Please try again later.');
       }
@@ -64,6 +64,8 @@ export default function LoginForm() {
                 'account-blocked': 'Account blocked, please contact support',
               };
               setError(errorMap[errorCode] || 'Login failed');
+        }else if (err.response?.status === 429) {
+            setError('Too many login attempts, please try again later');
         }else{
             setError('Login failed');
         }
@@ -49,6 +49,9 @@ export default function SignupForm() {
         if (err?.response?.status === 400) {
             setError(err?.response?.data?.error.includes('email') ? 'Email already exists' : err?.response?.data?.error.includes('username') ? 'Username already exists' : 'Registration failed');
         }
+        else if (err?.response?.status === 429) {
+          setError('Too many sign up attempts, please try again later');
+        }
         else{
           setError(err?.response?.data?.error || 'Registration failed');
         }
@@ -18,7 +18,7 @@ export function useOrdersManagement() {
         setLoading(true);
         const data = await AdminOrderService.list();
         
-        setOrders(data.orders); 
+        setOrders(data.results); 
       } catch (err) {
         setError(err.message);
       } finally {
@@ -1,4 +1,4 @@
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useRef } from 'react';
 import { addressService,checkOutService } from '../../../services/apiService';
 import { useNavigate } from 'react-router-dom';
 
@@ -10,6 +10,13 @@ export const useCheckout = () => {
 
   const [selectedAddressId, setSelectedAddressId] = useState('');
   const [paymentMethod, setPaymentMethod] = useState('cash-on-delivery');
+  // Reused across retries of the same checkout so the server never places it twice.
+  const idempotencyKeyRef = useRef(null);
+
+  useEffect(() => {
+    idempotencyKeyRef.current = null;
+  }, [selectedAddressId]);
+
   const [isNewAddressOpen, setIsNewAddressOpen] = useState(false);
   const [showSuccessModal, setShowSuccessModal] = useState(false);
 
@@ -59,7 +66,11 @@ export const useCheckout = () => {
 
   const placeOrder = async () => {
     try {
-      const placedOrder = await checkOutService.placeOrder(selectedAddressId);
+      if (!idempotencyKeyRef.current) {
+        idempotencyKeyRef.current = crypto.randomUUID();
+      }
+      const placedOrder = await checkOutService.placeOrder(selectedAddressId, idempotencyKeyRef.current);
+      idempotencyKeyRef.current = null;
       clearCart();
       setShowSuccessModal(true);
       setTimeout(() => {
@@ -13,7 +13,7 @@ export const useOrders = () => {
     try {
       const data = await orderService.list();
       
-      const ordersArray = data.orders || (Array.isArray(data) ? data : []);
+      const ordersArray = data.results || data.orders || (Array.isArray(data) ? data : []);
       
       setOrders(ordersArray);
     } catch (err) {
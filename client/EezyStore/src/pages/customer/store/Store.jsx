@@ -5,7 +5,7 @@ import { useProducts } from './_lib';
 
 
 const Store = () => {
-  const { products, productRatings, addToCart, loading } = useProducts();
+  const { products, productRatings, addToCart, loading, hasMore, loadMore, loadingMore } = useProducts();
 
   const renderStars = (rating) => {
     const stars = [];
@@ -76,6 +76,17 @@ const Store = () => {
               </motion.div>
             ))}
           </div>
+          {hasMore && (
+            <div className="flex justify-center mt-8">
+              <button
+                onClick={loadMore}
+                disabled={loadingMore}
+                className="bg-white border border-blue-600 text-blue-600 px-4 py-2 rounded hover:bg-blue-50 transition-colors disabled:opacity-50"
+              >
+                {loadingMore ? 'Loading...' : 'Load more'}
+              </button>
+            </div>
+          )}
         </main>
       </div>
     </Layout>
@@ -5,21 +5,27 @@ export const useProducts = () => {
   const [products, setProducts] = useState([]);
   const [productRatings, setProductRatings] = useState({});
   const [loading, setLoading] = useState(false);
+  const [nextPage, setNextPage] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
-  const fetchProducts = async () => {
-    setLoading(true);
+  // Appends a page of products; without `pageUrl` the list starts over.
+  const fetchProducts = async (pageUrl) => {
+    const setBusy = pageUrl ? setLoadingMore : setLoading;
+    setBusy(true);
     try {
-      const data = await productService.list();
-      setProducts(data);
+      const data = await productService.list(pageUrl);
+      const results = data.results || [];
+      setProducts(previous => (pageUrl ? [...previous, ...results] : results));
+      setNextPage(data.next || null);
       const ratings = {};
-      data.forEach(product => {
+      results.forEach(product => {
         ratings[product.id] = product.average_rating || 0;
       });
-      setProductRatings(ratings);
+      setProductRatings(previous => (pageUrl ? { ...previous, ...ratings } : ratings));
     } catch (error) {
       // console.error('Failed to fetch products:', error);
     } finally {
-      setLoading(false);
+      setBusy(false);
     }
   };
 
@@ -27,6 +33,12 @@ export const useProducts = () => {
     fetchProducts();
   }, []);
 
+  const loadMore = () => {
+    if (nextPage && !loadingMore) {
+      fetchProducts(nextPage);
+    }
+  };
+
   const addToCart = async (product) => {
     try {
       const updatedCart = await cartService.addToCart(product.id, 1);
@@ -46,5 +58,5 @@ export const useProducts = () => {
     }
   };
 
-  return { products, productRatings, loading, addToCart };
+  return { products, productRatings, loading, addToCart, hasMore: Boolean(nextPage), loadMore, loadingMore };
 };
@@ -97,8 +97,9 @@ export const adminProductService = {
 
 
 export const productService = {
-  list: async () => {
-    const response = await api.get(API_ENDPOINTS.products.list);
+  // Pass the `next` link of a previous page to fetch the page after it.
+  list: async (pageUrl) => {
+    const response = await api.get(pageUrl || API_ENDPOINTS.products.list);
     return response.data;
   },
 };
@@ -158,8 +159,9 @@ export const checkOutService = {
     return response.data;
   },
 
-  placeOrder: async (selectedAddressId) => {
-    const response = await api.post(API_ENDPOINTS.checkout.placeOrder, { address_id: selectedAddressId });
+  placeOrder: async (selectedAddressId, idempotencyKey) => {
+    const config = idempotencyKey ? { headers: { 'Idempotency-Key': idempotencyKey } } : undefined;
+    const response = await api.post(API_ENDPOINTS.checkout.placeOrder, { address_id: selectedAddressId }, config);
     return response.data;
   },
 };
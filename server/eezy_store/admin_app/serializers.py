@@ -84,8 +84,6 @@ class OrderSerializer(serializers.ModelSerializer):
     """Serializer for order list in admin views"""
     user = UserSerializer()
     address = serializers.StringRelatedField()
-    items_count = serializers.SerializerMethodField()
-    total_amount = serializers.DecimalField(max_digits=10, decimal_places=2, source='calculate_total')
     
     class Meta:
         model = Order
@@ -93,9 +91,6 @@ class OrderSerializer(serializers.ModelSerializer):
             'id', 'user', 'address', 'status', 'total_amount', 
             'items_count', 'created_at', 'updated_at'
         ]
-    
-    def get_items_count(self, obj):
-        return obj.items.count()
 
 
 class OrderDetailSerializer(serializers.ModelSerializer):
@@ -103,7 +98,6 @@ class OrderDetailSerializer(serializers.ModelSerializer):
     user = UserSerializer()
     address = AddressSerializer()
     items = OrderItemSerializer(many=True)
-    total_amount = serializers.DecimalField(max_digits=10, decimal_places=2, source='calculate_total')
     
     class Meta:
         model = Order
@@ -129,6 +123,42 @@ class OrderStatusUpdateSerializer(serializers.ModelSerializer):
         return value
     
 
+class OrderStatusChangeSerializer(serializers.Serializer):
+    order_id = serializers.IntegerField(min_value=1)
+    status = serializers.ChoiceField(choices=Order.STATUS_CHOICES)
+
+
+class BulkOrderStatusSerializer(serializers.Serializer):
+    """Serializer for changing the status of many orders in one request"""
+    MAX_CHANGES = 500
+
+    changes = OrderStatusChangeSerializer(many=True, allow_empty=False, max_length=MAX_CHANGES)
+
+    def validate_changes(self, value):
+        order_ids = [change['order_id'] for change in value]
+        if len(order_ids) != len(set(order_ids)):
+            raise serializers.ValidationError("Each order may appear only once.")
+        return value
+
+
 class TopProductSerializer(serializers.Serializer):
     product_name = serializers.CharField()
-    total_sales = serializers.IntegerField()
\ No newline at end of file
+    total_sales = serializers.IntegerField()
+    total_revenue = serializers.DecimalField(max_digits=14, decimal_places=2)
+
+class SalesPointSerializer(serializers.Serializer):
+    start = serializers.DateTimeField()
+    orders = serializers.IntegerField()
+    revenue = serializers.DecimalField(max_digits=14, decimal_places=2)
+    average_order_value = serializers.DecimalField(max_digits=14, decimal_places=2)
+
+
+class SalesTotalsSerializer(serializers.Serializer):
+    orders = serializers.IntegerField()
+    revenue = serializers.DecimalField(max_digits=14, decimal_places=2)
+    average_order_value = serializers.DecimalField(max_digits=14, decimal_places=2)
+
+
+class UniqueBuyersDaySerializer(serializers.Serializer):
+    day = serializers.DateField()
+    unique_buyers = serializers.IntegerField()
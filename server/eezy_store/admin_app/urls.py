@@ -1,11 +1,14 @@
-from django.urls import path
+from django.urls import path, re_path
 from .views import (AdminLoginView, ListAllCustomersView, 
                     ApproveCustomerView, BlockUserView, 
                     UnblockUserView, ProductCreateView,
                     ProductListView,ProductUpdateView,
                     ProductSoftDeleteView, OrderDetailView,
                     OrderListView, OrderStatusUpdateView,
-                    TopProductsAPIView
+                    BulkOrderStatusUpdateView,
+                    TopProductsAPIView, CacheStatsView,
+                    OrderExportView, ProductExportView,
+                    SalesAnalyticsView, UniqueBuyersView
                     )
 
 urlpatterns = [
@@ -22,8 +25,15 @@ urlpatterns = [
     path('products/<int:pk>/soft-delete/', ProductSoftDeleteView.as_view(), name='product-soft-delete'),
 
     path('orders/', OrderListView.as_view(), name='admin-order-list'),
+    path('orders/bulk-status/', BulkOrderStatusUpdateView.as_view(), name='admin-order-bulk-status'),
     path('orders/<int:pk>/', OrderDetailView.as_view(), name='admin-order-detail'),
     path('orders/<int:pk>/status/', OrderStatusUpdateView.as_view(), name='admin-order-status-update'),
 
+    re_path(r'^exports/orders\.(?P<export_format>csv|jsonl)$', OrderExportView.as_view(), name='export-orders'),
+    re_path(r'^exports/products\.(?P<export_format>csv|jsonl)$', ProductExportView.as_view(), name='export-products'),
+
     path('top-products/', TopProductsAPIView.as_view(), name='top-products'),
+    path('analytics/sales/', SalesAnalyticsView.as_view(), name='analytics-sales'),
+    path('analytics/unique-buyers/', UniqueBuyersView.as_view(), name='analytics-unique-buyers'),
+    path('cache-stats/', CacheStatsView.as_view(), name='cache-stats'),
 ]
\ No newline at end of file
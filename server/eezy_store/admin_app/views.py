@@ -1,4 +1,6 @@
 import logging
+from datetime import datetime, time, timedelta
+from itertools import groupby
 from django.contrib.auth.models import User, Group
 from django.contrib.auth import login, logout
 from rest_framework import generics, permissions, status
@@ -8,42 +10,54 @@ from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
 from rest_framework_simplejwt.views import TokenRefreshView
 from rest_framework_simplejwt.exceptions import InvalidToken
-from rest_framework.pagination import PageNumberPagination
 from django.shortcuts import get_object_or_404
 from django.core.exceptions import ObjectDoesNotExist
 from django.db.models import Prefetch, F, Sum
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.exceptions import NotFound, ValidationError
 
 from core_app.models import Address, Product, Rating, Order, OrderItem
+from core_app.pagination import CustomerPagination, ProductPagination, OrderPagination
+from core_app.authentication import user_cache
+from core_app.cache import catalog_cache
+from core_app.throttling import AccountThrottle, AccountThrottleMixin, IPThrottle, throttle_stats
+from core_app.rollups import (SALES_WINDOWS, SALES_INTERVALS, sales_series,
+                              top_products as top_products_from_rollups,
+                              unique_buyers)
+from core_app.streaming import (serialize_iterator, stream_json_list, stream_csv,
+                                stream_jsonl, buffered, gzip_stream)
 
 from .permission import IsAdmin
 from .serializers import (LoginSerializer, CustomerListSerializer,
                           ProductSerializer, OrderSerializer,
                           OrderDetailSerializer,OrderStatusUpdateSerializer,
-                          TopProductSerializer
+                          BulkOrderStatusSerializer,
+                          TopProductSerializer, SalesPointSerializer,
+                          SalesTotalsSerializer, UniqueBuyersDaySerializer
                           )
 
 logger = logging.getLogger(__name__)
 
-class CustomerPagination(PageNumberPagination):
-    """Custom pagination for customers list"""
-    page_size = 25
-    page_size_query_param = 'page_size'
-    max_page_size = 100
-
-class ProductPagination(PageNumberPagination):
-    """Custom pagination for customers list"""
-    page_size = 24
-    page_size_query_param = 'page_size'
-    max_page_size = 100
-    
-class OrderPagination(PageNumberPagination):
-    """Custom pagination for customers list"""
-    page_size = 25
-    page_size_query_param = 'page_size'
-    max_page_size = 100
+
+def parse_filter_datetime(params, name):
+    """Parse an ISO date or datetime query parameter, raising a 400 if malformed."""
+    value = params.get(name)
+    if not value:
+        return None
+    parsed = parse_datetime(value)
+    if parsed is None:
+        day = parse_date(value)
+        if day is None:
+            raise ValidationError({name: f"Invalid date '{value}'. Use YYYY-MM-DD or ISO 8601."})
+        parsed = datetime.combine(day, time.min)
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
 
 
-class AdminLoginView(APIView):
+class AdminLoginView(AccountThrottleMixin, APIView):
     """
     Admin Login View.
 
@@ -59,10 +73,14 @@ class AdminLoginView(APIView):
     - 200: Admin logged in successfully, returns access token and user info.
     - 400: Validation error (e.g., incorrect credentials or permission denied).
     - 403: If user is inactive or not permitted.
+    - 429: Too many attempts from this address or failed attempts for this account.
     - Sets HTTP-only secure cookie with refresh token.
     """
     
     permission_classes = [permissions.AllowAny]
+    throttle_classes = [IPThrottle, AccountThrottle]
+    throttle_scope = 'admin_login'
+    throttle_account_field = 'username'
     
     def post(self, request):
         serializer = LoginSerializer(data=request.data)
@@ -174,6 +192,7 @@ class ApproveCustomerView(APIView):
         
             customer.is_active = True
             customer.save()
+            user_cache.invalidate(customer.pk)
             
             logger.info("Customer approved successfully", extra={'id': customer_id})
             return Response(
@@ -221,6 +240,8 @@ class BlockUserView(APIView):
             if user.is_active:
                 user.is_active = False
                 user.save()
+                # Drop the cached user so the block applies to the next request.
+                user_cache.invalidate(user.pk)
                 logger.info(f"User {user_id} blocked successfully.")
                 return Response({"detail": "User blocked successfully"}, status=status.HTTP_200_OK)
             else:
@@ -265,6 +286,7 @@ class UnblockUserView(APIView):
             if not user.is_active:
                 user.is_active = True
                 user.save()
+                user_cache.invalidate(user.pk)
                 logger.info(f"User {user_id} unblocked successfully.")
                 return Response({"detail": "User unblocked successfully"}, status=status.HTTP_200_OK)
             else:
@@ -293,7 +315,7 @@ class ProductListView(generics.ListAPIView):
     - None required.
 
     Responses:
-    - 200: List of products with pagination.
+    - 200: List of products with keyset pagination (`?cursor=`, `?ordering=`).
     - 400: Bad request with error message.
     - 403: If the user is not an admin.
     """
@@ -303,8 +325,7 @@ class ProductListView(generics.ListAPIView):
     pagination_class = ProductPagination
     
     def get_queryset(self):
-        return Product.objects.with_ratings().filter(
-            is_deleted=False)
+        return Product.objects.active()
     
 
 class ProductCreateView(generics.CreateAPIView):
@@ -402,41 +423,64 @@ class ProductSoftDeleteView(generics.UpdateAPIView):
 
 class OrderListView(generics.ListAPIView):
     """
-    List all orders with efficient ORM queries for admin panel.
+    List orders for the admin panel with keyset pagination.
+
+    Allows authenticated admin users to page through orders, newest first,
+    optionally filtered by status and creation date. Listing uses
+    `select_related` and the stored `total_amount`/`items_count` columns so
+    every page costs a constant number of queries.
 
-    Allows authenticated admin users to view all orders, optimized with 
-    `select_related` and `prefetch_related` to minimize database queries 
-    and improve performance.
+    * GET - List orders with associated user and address.
 
-    * GET - List all orders with associated user, address, and items.
+    Query Parameters:
+    - cursor (str): Opaque cursor taken from the `next`/`previous` links.
+    - page_size (int): Number of orders per page (max 100).
+    - status (str): Only orders with this status (`approved`, `shipped`, `delivered`).
+    - created_after (date/datetime): Only orders created at or after this time.
+    - created_before (date/datetime): Only orders created before this time.
+    - stream (bool): When `true`, skip pagination and stream every matching
+      order as `{"orders": [...]}`, read from a server-side cursor in chunks.
 
     Request Body:
     - None
 
     Responses:
-    - 200: A list of all orders with associated user, address, and items.
+    - 200: A page of orders (or the streamed export).
+    - 400: Invalid status or date filter.
     - 403: If user is not an admin.
-    - 404: If no orders are found.
     """
     
     permission_classes = [IsAdmin]
     serializer_class = OrderSerializer
+    pagination_class = OrderPagination
+    stream_chunk_size = 500
     
     def get_queryset(self):
-        return Order.objects.all() \
-            .select_related('user', 'address') \
-            .prefetch_related(
-                Prefetch(
-                    'items',
-                    queryset=OrderItem.objects.select_related('product')
-                )
-            ) \
-            .order_by('-created_at')
+        queryset = Order.objects.select_related('user', 'address')
+        params = self.request.query_params
+
+        order_status = params.get('status')
+        if order_status:
+            if order_status not in dict(Order.STATUS_CHOICES):
+                raise ValidationError({'status': f"Invalid status '{order_status}'."})
+            queryset = queryset.filter(status=order_status)
+
+        created_after = parse_filter_datetime(params, 'created_after')
+        if created_after:
+            queryset = queryset.filter(created_at__gte=created_after)
+        created_before = parse_filter_datetime(params, 'created_before')
+        if created_before:
+            queryset = queryset.filter(created_at__lt=created_before)
+
+        return queryset
     
     def list(self, request, *args, **kwargs):
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        return Response({"orders": serializer.data}, status=status.HTTP_200_OK)
+        if request.query_params.get('stream', '').lower() in ('1', 'true'):
+            queryset = self.get_queryset().order_by('-created_at', '-id')
+            rows = serialize_iterator(queryset, self.get_serializer_class(), self.stream_chunk_size)
+            logger.info("Streaming order export", extra={'data': dict(request.query_params)})
+            return StreamingHttpResponse(stream_json_list('orders', rows), content_type='application/json')
+        return super().list(request, *args, **kwargs)
 
 
 class OrderDetailView(generics.RetrieveAPIView):
@@ -476,16 +520,18 @@ class OrderStatusUpdateView(generics.UpdateAPIView):
     """
     Update the status of an order.
 
-    Allows authenticated admin users to update the status of a specific order.
+    Allows authenticated admin users to update the status of a specific order. Orders
+    only move forward (approved → shipped → delivered), and every change is recorded
+    in the order's status history.
 
-    * PATCH - Update the status of an order (e.g., pending → shipped, delivered, etc.).
+    * PATCH - Update the status of an order (e.g., approved → shipped, delivered).
 
     Request Body:
     - status: The new status for the order.
 
     Responses:
     - 200: Order status updated successfully.
-    - 400: Bad request with validation error.
+    - 400: Bad request with validation error, or a backwards transition.
     - 403: If user is not an admin.
     - 404: If the order with the given ID does not exist.
     """
@@ -501,39 +547,403 @@ class OrderStatusUpdateView(generics.UpdateAPIView):
         serializer = self.get_serializer(instance, data=request.data, partial=partial)
         serializer.is_valid(raise_exception=True)
 
-        data = {'status': serializer.validated_data.get('status')}
-        self.perform_update(serializer)
+        new_status = serializer.validated_data.get('status', instance.status)
+        outcome, from_status = Order.objects.transition_statuses(
+            {instance.pk: new_status}, changed_by=request.user
+        )[instance.pk]
+        if outcome == 'not_found':
+            raise NotFound()
+        if outcome == 'invalid_transition':
+            raise ValidationError({'status': f"Cannot change an order from '{from_status}' to '{new_status}'."})
+        instance.status = new_status
         
         logger.info(f'Order_id: {instance.id} Order status updated successfully', extra={'data': serializer.validated_data})
-        return Response(serializer.data)
+        return Response(self.get_serializer(instance).data)
     
     
+class BulkOrderStatusUpdateView(APIView):
+    """
+    Update the status of many orders at once.
+
+    Allows authenticated admin users to, for example, mark a whole batch of orders
+    shipped or delivered. Orders only move forward (approved → shipped → delivered);
+    each change is validated against the order's current status, and the valid ones
+    are applied with one UPDATE per target status. Every applied change is recorded
+    in the order's status history.
+
+    * POST - Change order statuses.
+
+    Request Body:
+    - changes: List (max 500) of `{"order_id": int, "status": str}`.
+
+    Responses:
+    - 200: `{"updated": int, "results": [{"order_id", "outcome", "from_status", "status"}]}`
+      where outcome is `updated`, `unchanged`, `invalid_transition` or `not_found`.
+    - 400: Bad request with validation error.
+    - 403: If user is not an admin.
+    """
+
+    permission_classes = [IsAdmin]
+
+    def post(self, request):
+        serializer = BulkOrderStatusSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        changes = {change['order_id']: change['status'] for change in serializer.validated_data['changes']}
+        outcomes = Order.objects.transition_statuses(changes, changed_by=request.user)
+
+        results = [
+            {'order_id': order_id, 'outcome': outcome, 'from_status': from_status, 'status': changes[order_id]}
+            for order_id, (outcome, from_status) in outcomes.items()
+        ]
+        updated = sum(1 for result in results if result['outcome'] == 'updated')
+        logger.info(f"Bulk status update: {updated} of {len(results)} order(s) updated")
+        return Response({'updated': updated, 'results': results}, status=status.HTTP_200_OK)
+
+
 class TopProductsAPIView(APIView):
     """
     Retrieve top-rated products.
 
     Allows authenticated admin users to view the top-rated products based on sale.
+    Windows are served from the product sales rollups maintained at order placement,
+    so the cost grows with the number of products rather than with order history.
 
     * GET - Retrieve top-rated products.
 
+    Query Parameters:
+    - window (optional): `today`, `7d`, `30d` or `all` (default).
+    - created_after (optional): Only count sales on or after this date/datetime.
+    - created_before (optional): Only count sales before this date/datetime.
+      An exact date range is computed from the order items instead of the rollups;
+      it only reads the matching order item partitions.
+
     Request Body:
     - None
 
     Responses:
-    - 200: List of top-sale products.
+    - 200: List of top-sale products with units sold and revenue.
+    - 400: Invalid window or date filter.
     - 403: If user is not an admin.
     """
     
     permission_classes = [IsAdmin]
     
     def get(self, request):
-        top_products = (
-            OrderItem.objects
-            .values(product_name=F('product__name'))
-            .annotate(total_sales=Sum('quantity'))
-            .order_by('-total_sales')[:10]
-        )
+        params = request.query_params
+        created_after = parse_filter_datetime(params, 'created_after')
+        created_before = parse_filter_datetime(params, 'created_before')
+
+        if created_after or created_before:
+            items = OrderItem.objects.all()
+            if created_after:
+                items = items.filter(created_at__gte=created_after)
+            if created_before:
+                items = items.filter(created_at__lt=created_before)
+            top_products = (
+                items
+                .values(product_name=F('product__name'))
+                .annotate(total_sales=Sum('quantity'), total_revenue=Sum(F('quantity') * F('price')))
+                .order_by('-total_sales')[:10]
+            )
+        else:
+            window = params.get('window', 'all')
+            if window not in SALES_WINDOWS:
+                raise ValidationError({'window': f"Invalid window '{window}'. Use one of: {', '.join(SALES_WINDOWS)}."})
+            top_products = top_products_from_rollups(window)
+
         serializer = TopProductSerializer(top_products, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
-    
-    
\ No newline at end of file
+
+
+class SalesAnalyticsView(APIView):
+    """
+    Retrieve revenue, order count and average order value over time.
+
+    Allows authenticated admin users to chart sales per hour, day or week. The series
+    is served from hourly and daily sales buckets kept up to date as orders are placed
+    and change status, so it stays fast over years of orders. Periods without orders
+    are returned with zeros.
+
+    * GET - Retrieve the sales series.
+
+    Query Parameters:
+    - interval (optional): `hour`, `day` (default) or `week` (starting Monday).
+    - start (optional): Start date/datetime; defaults to 30 days before `end`.
+    - end (optional): End date/datetime (exclusive); defaults to now.
+    - status (optional): Only count orders currently in this status, e.g. `delivered`.
+
+    Request Body:
+    - None
+
+    Responses:
+    - 200: `{"interval", "start", "end", "status", "points": [...], "totals": {...}}`, where
+      each point has `start`, `orders`, `revenue` and `average_order_value`.
+    - 400: Invalid parameter, or too many points for the interval.
+    - 403: If user is not an admin.
+    """
+
+    permission_classes = [IsAdmin]
+
+    def get(self, request):
+        params = request.query_params
+        interval = params.get('interval', 'day')
+        if interval not in SALES_INTERVALS:
+            raise ValidationError({'interval': f"Invalid interval '{interval}'. Use one of: {', '.join(SALES_INTERVALS)}."})
+
+        order_status = params.get('status')
+        if order_status and order_status not in dict(Order.STATUS_CHOICES):
+            raise ValidationError({'status': f"Invalid status '{order_status}'."})
+
+        end = parse_filter_datetime(params, 'end') or timezone.now()
+        start = parse_filter_datetime(params, 'start') or end - timedelta(days=30)
+        if start >= end:
+            raise ValidationError({'start': "Start must be before end."})
+
+        try:
+            series = sales_series(start, end, interval, status=order_status)
+        except ValueError as e:
+            raise ValidationError({'interval': str(e)})
+
+        return Response({
+            'interval': interval,
+            'start': start,
+            'end': end,
+            'status': order_status,
+            'points': SalesPointSerializer(series['points'], many=True).data,
+            'totals': SalesTotalsSerializer(series['totals']).data,
+        }, status=status.HTTP_200_OK)
+
+
+class UniqueBuyersView(APIView):
+    """
+    Retrieve the approximate number of distinct customers who placed orders.
+
+    Allows authenticated admin users to see unique buyers of one product, or unique
+    customers of the whole store, per day and over a date range. Counts come from
+    HyperLogLog sketches kept per product and day as orders are placed, and a
+    customer who ordered on several days is counted once in the range total.
+
+    Estimates have a relative standard error of about 1.6% (`standard_error`); about
+    95% of them are within 3.3% of the true count. Counts below a few thousand are
+    close to exact. Orders show up once the background worker has processed them.
+
+    * GET - Retrieve unique buyer counts.
+
+    Query Parameters:
+    - product_id (optional): Count buyers of this product; defaults to the whole store.
+    - start (optional): First day (YYYY-MM-DD); defaults to 29 days before `end`.
+    - end (optional): Last day, inclusive (YYYY-MM-DD); defaults to today.
+
+    Request Body:
+    - None
+
+    Responses:
+    - 200: `{"product_id", "start", "end", "unique_buyers", "standard_error", "days": [...]}`,
+      where each day with orders has `day` and `unique_buyers`.
+    - 400: Invalid parameter.
+    - 403: If user is not an admin.
+    - 404: If the product does not exist.
+    """
+
+    permission_classes = [IsAdmin]
+
+    def get(self, request):
+        params = request.query_params
+        product_id = params.get('product_id')
+        if product_id is not None:
+            if not product_id.isdigit():
+                raise ValidationError({'product_id': "Product id must be an integer."})
+            product_id = int(product_id)
+            if not Product.objects.filter(pk=product_id).exists():
+                raise NotFound("Product not found.")
+
+        end = parse_filter_datetime(params, 'end')
+        end = timezone.localdate(end) if end else timezone.localdate()
+        start = parse_filter_datetime(params, 'start')
+        start = timezone.localdate(start) if start else end - timedelta(days=29)
+        if start > end:
+            raise ValidationError({'start': "Start must not be after end."})
+
+        counts = unique_buyers(start, end, product_id=product_id)
+
+        return Response({
+            'product_id': product_id,
+            'start': start,
+            'end': end,
+            'unique_buyers': counts['unique_buyers'],
+            'standard_error': round(counts['standard_error'], 4),
+            'days': UniqueBuyersDaySerializer(counts['days'], many=True).data,
+        }, status=status.HTTP_200_OK)
+
+
+def export_response(chunks, filename, content_type, compress=False):
+    """Wrap export chunks in a downloadable `StreamingHttpResponse`, gzipped on request."""
+    chunks = buffered(chunks)
+    if compress:
+        chunks = gzip_stream(chunks)
+        filename += '.gz'
+        content_type = 'application/gzip'
+    response = StreamingHttpResponse(chunks, content_type=content_type)
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+
+EXPORT_CONTENT_TYPES = {'csv': 'text/csv', 'jsonl': 'application/x-ndjson'}
+
+
+class OrderExportView(APIView):
+    """
+    Export orders with their items as CSV or JSON Lines.
+
+    Allows authenticated admin users to download every matching order in one
+    consistent file instead of paging through the order list. Rows are read
+    from a server-side cursor in chunks and written to the response as they
+    arrive, so memory use does not grow with the number of orders.
+
+    * GET - Download the export (`exports/orders.csv` or `exports/orders.jsonl`).
+
+    Query Parameters:
+    - status (str): Only orders with this status (`approved`, `shipped`, `delivered`).
+    - created_after (date/datetime): Only orders created at or after this time.
+    - created_before (date/datetime): Only orders created before this time.
+    - gzip (bool): When `true`, the file is gzip-compressed (`.gz`).
+
+    Request Body:
+    - None
+
+    Responses:
+    - 200: CSV with one line per order item, or JSON Lines with one order
+      (and its `items`) per line, ordered by order id.
+    - 400: Invalid status or date filter.
+    - 403: If user is not an admin.
+    """
+
+    permission_classes = [IsAdmin]
+    chunk_size = 2000
+    order_fields = ['order_id', 'created_at', 'status', 'username', 'email', 'total_amount', 'items_count']
+    item_fields = ['product_id', 'product_name', 'quantity', 'price']
+
+    def get(self, request, export_format):
+        params = request.query_params
+        items = OrderItem.objects.all()
+
+        order_status = params.get('status')
+        if order_status:
+            if order_status not in dict(Order.STATUS_CHOICES):
+                raise ValidationError({'status': f"Invalid status '{order_status}'."})
+            items = items.filter(order__status=order_status)
+
+        # OrderItem.created_at is a copy of the order's, so these filters also prune partitions.
+        created_after = parse_filter_datetime(params, 'created_after')
+        if created_after:
+            items = items.filter(created_at__gte=created_after)
+        created_before = parse_filter_datetime(params, 'created_before')
+        if created_before:
+            items = items.filter(created_at__lt=created_before)
+
+        rows = items.order_by('order_id', 'id').values_list(
+            'order_id', 'order__created_at', 'order__status', 'order__user__username',
+            'order__user__email', 'order__total_amount', 'order__items_count',
+            'product_id', 'product__name', 'quantity', 'price',
+        ).iterator(chunk_size=self.chunk_size)
+
+        if export_format == 'csv':
+            chunks = stream_csv(self.order_fields + self.item_fields, rows)
+        else:
+            chunks = stream_jsonl(self.group_orders(rows))
+
+        logger.info("Exporting orders", extra={'data': dict(params)})
+        return export_response(
+            chunks,
+            f"orders-{timezone.now():%Y%m%d-%H%M%S}.{export_format}",
+            EXPORT_CONTENT_TYPES[export_format],
+            compress=params.get('gzip', '').lower() in ('1', 'true'),
+        )
+
+    def group_orders(self, rows):
+        """Fold consecutive item rows of the same order into one order with `items`."""
+        order_width = len(self.order_fields)
+        for _, order_rows in groupby(rows, key=lambda row: row[0]):
+            first = next(order_rows)
+            order = dict(zip(self.order_fields, first[:order_width]))
+            order['items'] = [
+                dict(zip(self.item_fields, row[order_width:]))
+                for row in (first, *order_rows)
+            ]
+            yield order
+
+
+class ProductExportView(APIView):
+    """
+    Export the product catalog as CSV or JSON Lines.
+
+    Allows authenticated admin users to download the whole catalog in one file.
+    Rows are streamed from a server-side cursor, so memory use stays constant.
+
+    * GET - Download the export (`exports/products.csv` or `exports/products.jsonl`).
+
+    Query Parameters:
+    - include_deleted (bool): When `true`, soft-deleted products are included.
+    - gzip (bool): When `true`, the file is gzip-compressed (`.gz`).
+
+    Request Body:
+    - None
+
+    Responses:
+    - 200: One product per line, ordered by id.
+    - 403: If user is not an admin.
+    """
+
+    permission_classes = [IsAdmin]
+    chunk_size = 2000
+    fields = ['id', 'name', 'description', 'price', 'average_rating', 'rating_count',
+              'is_deleted', 'created_at', 'updated_at']
+
+    def get(self, request, export_format):
+        params = request.query_params
+        products = Product.objects.all()
+        if params.get('include_deleted', '').lower() not in ('1', 'true'):
+            products = products.active()
+
+        rows = products.order_by('id').values_list(*self.fields).iterator(chunk_size=self.chunk_size)
+        if export_format == 'csv':
+            chunks = stream_csv(self.fields, rows)
+        else:
+            chunks = stream_jsonl(dict(zip(self.fields, row)) for row in rows)
+
+        logger.info("Exporting products", extra={'data': dict(params)})
+        return export_response(
+            chunks,
+            f"products-{timezone.now():%Y%m%d-%H%M%S}.{export_format}",
+            EXPORT_CONTENT_TYPES[export_format],
+            compress=params.get('gzip', '').lower() in ('1', 'true'),
+        )
+
+
+class CacheStatsView(APIView):
+    """
+    Report hit/miss statistics for the application caches.
+
+    Allows authenticated admin users to check how effective the caching layers are.
+
+    * GET - Retrieve cache statistics.
+
+    Request Body:
+    - None
+
+    Responses:
+    - 200: Hits, misses and hit rate per cache, plus the authentication user
+      cache timeout and whether it is enabled, and the rate and number of shed
+      requests per login/signup/refresh throttle scope.
+    - 403: If user is not an admin.
+    """
+
+    permission_classes = [IsAdmin]
+
+    def get(self, request):
+        return Response({
+            'catalog': catalog_cache.stats(),
+            'users': user_cache.stats(),
+            'throttles': throttle_stats(),
+        }, status=status.HTTP_200_OK)
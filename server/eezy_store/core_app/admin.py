@@ -1,7 +1,7 @@
 from django.contrib import admin
 from django.contrib.auth.models import User
 from django.contrib.auth.admin import UserAdmin as DefaultUserAdmin
-from .models import Product, Rating, Address, Order, OrderItem, Cart, CartItem
+from .models import Product, Rating, Address, Order, OrderItem, Cart, CartItem, Stock, StockShard, Job, OrderStatusHistory
 
 class AddressInline(admin.TabularInline):
     model = Address
@@ -24,7 +24,7 @@ class ProductAdmin(admin.ModelAdmin):
     list_display = ['name', 'price', 'created_at', 'is_deleted', 'restore_product']
     search_fields = ['name']
     list_filter = ['created_at']
-    readonly_fields = ['created_at', 'updated_at']
+    readonly_fields = ['average_rating', 'rating_count', 'rating_sum', 'created_at', 'updated_at']
 
     def get_queryset(self, request):
         queryset = super().get_queryset(request)
@@ -37,11 +37,28 @@ class ProductAdmin(admin.ModelAdmin):
     restore_product.short_description = "Action"
 
 
+class StockShardInline(admin.TabularInline):
+    model = StockShard
+    extra = 0
+
+@admin.register(Stock)
+class StockAdmin(admin.ModelAdmin):
+    list_display = ['product', 'available', 'shard_count', 'updated_at']
+    search_fields = ['product__name']
+    readonly_fields = ['updated_at']
+    inlines = [StockShardInline]
+
+
 class OrderItemInline(admin.TabularInline):
     model = OrderItem
     extra = 0
     readonly_fields = ['product', 'quantity', 'price']  
 
+class OrderStatusHistoryInline(admin.TabularInline):
+    model = OrderStatusHistory
+    extra = 0
+    readonly_fields = ['from_status', 'to_status', 'changed_by', 'changed_at']
+
 @admin.register(Order)
 class OrderAdmin(admin.ModelAdmin):
     list_display = ['id', 'user', 'status', 'total_amount', 'created_at']
@@ -50,7 +67,7 @@ class OrderAdmin(admin.ModelAdmin):
     list_filter = ['status', 'created_at']
     search_fields = ['user__username']
     readonly_fields = ['created_at', 'updated_at']
-    inlines = [OrderItemInline] 
+    inlines = [OrderItemInline, OrderStatusHistoryInline] 
 
 
 class CartItemInline(admin.TabularInline):
@@ -63,3 +80,10 @@ class CartAdmin(admin.ModelAdmin):
     search_fields = ['user__username']
     inlines = [CartItemInline]
 
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ['id', 'name', 'status', 'attempts', 'max_attempts', 'run_at', 'created_at']
+    list_filter = ['status', 'name']
+    readonly_fields = ['locked_at', 'locked_by', 'last_error', 'created_at']
@@ -0,0 +1,122 @@
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from .cache import counter_stats, increment_counter
+
+
+class UserCache:
+    """
+    Short-lived cache of `User` rows for JWT authentication, keyed by user id.
+
+    Every user has a generation token that `invalidate` replaces, and entries
+    are stored with the generation read before the row was loaded; an entry
+    of an older generation is a miss. So a row loaded just before a change
+    commits is never served after the invalidation, even if it is stored
+    after it. Users are invalidated whenever they are saved (see
+    `core_app.signals`) and by the admin approve/block/unblock views, so a
+    block or password change takes effect on the next request.
+
+    That only holds if every worker shares the cache, so the cache is
+    bypassed (every request reads the user from the database) while `ALIAS`
+    names a process-local `LocMemCache`; point it at Redis (`REDIS_URL`) to
+    enable it.
+    """
+
+    HITS_KEY = 'auth:users:stats:hits'
+    MISSES_KEY = 'auth:users:stats:misses'
+
+    def __init__(self):
+        config = getattr(settings, 'AUTH_USER_CACHE', {})
+        self.alias = config.get('ALIAS', 'default')
+        self.timeout = config.get('TIMEOUT', 60)
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    @property
+    def enabled(self):
+        return not isinstance(self.cache, LocMemCache)
+
+    def key(self, user_id):
+        return f'auth:user:{user_id}'
+
+    def generation_key(self, user_id):
+        return f'auth:user:{user_id}:generation'
+
+    def get(self, user_id):
+        """Return `(user, generation)`, with `user` None on a miss; pass `generation` to `set`."""
+        key, generation_key = self.key(user_id), self.generation_key(user_id)
+        values = self.cache.get_many([key, generation_key])
+        generation = values.get(generation_key)
+        if generation is None:
+            # Never set, or evicted: a fresh token also voids any old entry.
+            self.cache.add(generation_key, uuid4().hex, timeout=None)
+            generation = self.cache.get(generation_key)
+
+        entry = values.get(key)
+        user = entry[1] if entry is not None and entry[0] == generation else None
+        increment_counter(self.cache, self.MISSES_KEY if user is None else self.HITS_KEY)
+        return user, generation
+
+    def set(self, user, generation):
+        self.cache.set(self.key(user.pk), (generation, user), timeout=self.timeout)
+
+    def invalidate(self, user_id):
+        self.cache.set(self.generation_key(user_id), uuid4().hex, timeout=None)
+        self.cache.delete(self.key(user_id))
+
+    def stats(self):
+        return {
+            'enabled': self.enabled,
+            'timeout': self.timeout,
+            **counter_stats(self.cache, self.HITS_KEY, self.MISSES_KEY),
+        }
+
+
+user_cache = UserCache()
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    `JWTAuthentication` that loads the token's user through `user_cache`.
+
+    Performs the same checks as the parent class (user exists, is active
+    and, if enabled, has not changed password since the token was issued)
+    on the cached user, so only cache misses query the database. Falls back
+    to the parent's lookup while `user_cache` is disabled.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        if not user_cache.enabled:
+            return super().get_user(validated_token)
+
+        user, generation = user_cache.get(user_id)
+        if user is None:
+            try:
+                user = self.user_model.objects.get(**{api_settings.USER_ID_FIELD: user_id})
+            except self.user_model.DoesNotExist:
+                raise AuthenticationFailed(_("User not found"), code="user_not_found")
+            user_cache.set(user, generation)
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(_("The user's password has been changed."), code="password_changed")
+
+        return user
@@ -0,0 +1,41 @@
+import hashlib
+import math
+
+import numpy as np
+
+
+class BloomFilter:
+    """
+    Set membership test with no false negatives and a bounded false-positive rate.
+
+    Sized for `capacity` items at `error_rate`; adding more items than that
+    raises the false-positive rate but never causes a false negative. Each
+    item sets `hashes` bits derived from one blake2b digest by double
+    hashing. Not thread safe for concurrent adds; readers may run alongside
+    a single writer.
+    """
+
+    def __init__(self, capacity, error_rate=0.001):
+        capacity = max(capacity, 1)
+        self.size = max(int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)), 8)
+        self.hashes = max(int(round(self.size / capacity * math.log(2))), 1)
+        self.bits = np.zeros((self.size + 7) // 8, dtype=np.uint8)
+        self.count = 0
+
+    def _positions(self, item):
+        digest = hashlib.blake2b(str(item).encode(), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], 'big'), int.from_bytes(digest[8:], 'big') | 1
+        return [(first + index * second) % self.size for index in range(self.hashes)]
+
+    def add(self, item):
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def update(self, items):
+        for item in items:
+            self.add(item)
+        return self
+
+    def __contains__(self, item):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
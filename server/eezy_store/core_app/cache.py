@@ -0,0 +1,110 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import Count, Max
+from rest_framework.response import Response
+
+from .models import Product
+
+
+def increment_counter(cache, key):
+    """Add one to a statistics counter in `cache`, creating it if missing or evicted."""
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, 1, timeout=None):
+            cache.incr(key)
+
+
+def counter_stats(cache, hits_key, misses_key):
+    hits = cache.get(hits_key, 0)
+    misses = cache.get(misses_key, 0)
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_rate': round(hits / total, 4) if total else None,
+    }
+
+
+class CatalogCache:
+    """
+    Cache for rendered product catalog responses, keyed by the catalog's state.
+
+    Each entry is keyed by the view's validator state (the newest active
+    product `updated_at` and the number of active products) plus the full
+    request URL, so every page, ordering and search query gets its own entry.
+    Product saves, soft deletes, restores and new ratings all change that
+    state, which makes every older entry unreachable at once; stale entries
+    simply age out.
+
+    The state is read from the database on every request, so a change is
+    seen by every worker as soon as it commits, whatever the cache backend:
+    with the per-process `LocMemCache` each worker just fills its own
+    entries. Only the hit/miss counters live in the cache.
+    """
+
+    HITS_KEY = 'catalog:stats:hits'
+    MISSES_KEY = 'catalog:stats:misses'
+
+    def __init__(self):
+        config = getattr(settings, 'CATALOG_CACHE', {})
+        self.alias = config.get('ALIAS', 'default')
+        self.timeout = config.get('TIMEOUT', 300)
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def key(self, request, state):
+        digest = hashlib.md5(repr((request.build_absolute_uri(), state)).encode()).hexdigest()
+        return f'catalog:{digest}'
+
+    def get(self, key):
+        data = self.cache.get(key)
+        self._count(self.MISSES_KEY if data is None else self.HITS_KEY)
+        return data
+
+    def set(self, key, data):
+        self.cache.set(key, data, timeout=self.timeout)
+
+    def stats(self):
+        return counter_stats(self.cache, self.HITS_KEY, self.MISSES_KEY)
+
+    def _count(self, key):
+        increment_counter(self.cache, key)
+
+
+catalog_cache = CatalogCache()
+
+
+class CatalogCacheMixin:
+    """
+    Serve a list view's rendered data from `catalog_cache`.
+
+    Only for views whose output depends on the active products and the URL
+    alone, never on the requesting user. Provides the catalog's
+    `get_validator_state`, which `conditional_get` can use as well.
+    """
+
+    def get_validator_state(self, request):
+        state = Product.objects.active().aggregate(last_modified=Max('updated_at'), count=Count('id'))
+        return (state['last_modified'], state['count'])
+
+    def list(self, request, *args, **kwargs):
+        # Read the state before rendering: if the catalog changes meanwhile,
+        # the page is stored under the old state, which is never looked up again.
+        # Reuse the state `conditional_get` built the ETag from, so the body
+        # served always matches it.
+        state = getattr(self, 'validator_state', None)
+        if state is None:
+            state = self.get_validator_state(request)
+        key = catalog_cache.key(request, state)
+        data = catalog_cache.get(key)
+        if data is not None:
+            return Response(data)
+        response = super().list(request, *args, **kwargs)
+        if response.status_code == 200:
+            catalog_cache.set(key, response.data)
+        return response
@@ -0,0 +1,35 @@
+from decimal import Decimal
+
+from django.db.models import F, Sum, Window
+
+from .models import CartItem
+
+
+def get_checkout_summary(user):
+    """
+    Return the user's cart lines and totals computed by the database.
+
+    A single query returns every cart line with its product, its line total
+    (`quantity * price`), and the grand total and item count as window
+    aggregates over the same rows. Checkout, order placement and the cart
+    endpoints all use this so totals are computed once, the same way.
+
+    Returns a dict with:
+    - items: CartItem instances annotated with `line_total`.
+    - item_count: Total quantity across all lines.
+    - total: Grand total as a Decimal.
+    """
+    line_total = F('quantity') * F('product__price')
+    items = list(
+        CartItem.objects.filter(cart__user=user)
+        .select_related('product')
+        .annotate(
+            line_total=line_total,
+            cart_total=Window(Sum(line_total)),
+            cart_quantity=Window(Sum('quantity')),
+        )
+        .order_by('id')
+    )
+    if not items:
+        return {'items': [], 'item_count': 0, 'total': Decimal('0.00')}
+    return {'items': items, 'item_count': items[0].cart_quantity, 'total': items[0].cart_total}
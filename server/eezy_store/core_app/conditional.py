@@ -0,0 +1,45 @@
+import functools
+import hashlib
+from datetime import datetime
+
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+
+
+def conditional_get(view_method):
+    """
+    Answer a view's `GET` with `304 Not Modified` when the client's copy is current.
+
+    The view implements `get_validator_state(request)`, returning a tuple of
+    cheap aggregate values (typically `Max('updated_at')` and `Count('id')`)
+    that change whenever the rendered response would. The ETag is a hash of
+    that state plus the request URL and user, and `Last-Modified` is the
+    newest datetime in it. Nothing is serialized unless the validators miss.
+
+    The state is kept on the view as `validator_state`, so a view that also
+    caches its body (see `CatalogCacheMixin`) looks it up under the same
+    state the ETag was computed from, and never pairs a new ETag with an
+    old body.
+    """
+
+    @functools.wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        state = self.validator_state = self.get_validator_state(request)
+        digest = hashlib.md5(repr((request.get_full_path(), request.user.pk, state)).encode()).hexdigest()
+        etag = quote_etag(digest)
+        timestamps = [value for value in state if isinstance(value, datetime)]
+        last_modified = int(max(timestamps).timestamp()) if timestamps else None
+
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = view_method(self, request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+
+        response['ETag'] = etag
+        if last_modified is not None:
+            response['Last-Modified'] = http_date(last_modified)
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+    return wrapper
@@ -0,0 +1,110 @@
+import functools
+import hashlib
+import json
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.response import Response
+
+from .models import IdempotencyKey
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_HEADER = 'HTTP_IDEMPOTENCY_KEY'
+MAX_KEY_LENGTH = 255
+
+
+class _Discard(Exception):
+    """Carries a non-2xx response out of the atomic block so the key is rolled back."""
+
+    def __init__(self, response):
+        self.response = response
+
+
+def request_fingerprint(request):
+    """Hash of the request path and body, used to reject a key reused for a different request."""
+    payload = json.dumps(request.data, sort_keys=True, default=str)
+    return hashlib.sha256(f"{request.path}\n{payload}".encode()).hexdigest()
+
+
+def _replay(record, fingerprint):
+    if record.fingerprint != fingerprint:
+        return Response(
+            {'detail': 'Idempotency-Key was already used with a different request.'},
+            status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        )
+    response = Response(record.response_body, status=record.status_code)
+    response['Idempotent-Replayed'] = 'true'
+    return response
+
+
+def idempotent(scope):
+    """
+    Make an authenticated `POST` safe to retry with an `Idempotency-Key` header.
+
+    The first request with a key inserts an `IdempotencyKey` row and runs the
+    view in the same transaction; a successful (2xx) response is stored on
+    the row and committed together with the view's writes. Any other outcome
+    rolls the row back so the client may retry with the same key.
+
+    A retry whose key is already committed gets the stored response back
+    without the view running. A concurrent duplicate blocks on the unique
+    constraint until the first request finishes, then replays its response
+    (or proceeds, if the first one was rolled back). Reusing a key for a
+    different body returns `422`. Requests without the header are unchanged.
+    """
+
+    def decorator(view_method):
+        @functools.wraps(view_method)
+        def wrapper(self, request, *args, **kwargs):
+            key = request.META.get(IDEMPOTENCY_HEADER)
+            if not key:
+                return view_method(self, request, *args, **kwargs)
+            if len(key) > MAX_KEY_LENGTH:
+                return Response(
+                    {'detail': f'Idempotency-Key must be at most {MAX_KEY_LENGTH} characters.'},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            fingerprint = request_fingerprint(request)
+            lookup = {'user': request.user, 'scope': scope, 'key': key}
+            now = timezone.now()
+
+            record = IdempotencyKey.objects.filter(**lookup, expires_at__gt=now).first()
+            if record is not None and record.status_code is not None:
+                return _replay(record, fingerprint)
+            IdempotencyKey.objects.filter(**lookup, expires_at__lte=now).delete()
+
+            try:
+                with transaction.atomic():
+                    record = IdempotencyKey.objects.create(
+                        **lookup,
+                        fingerprint=fingerprint,
+                        expires_at=now + timedelta(seconds=settings.IDEMPOTENCY_KEY_TTL),
+                    )
+                    response = view_method(self, request, *args, **kwargs)
+                    if not status.is_success(response.status_code):
+                        raise _Discard(response)
+
+                    record.status_code = response.status_code
+                    record.response_body = response.data
+                    record.save(update_fields=['status_code', 'response_body'])
+            except _Discard as discarded:
+                return discarded.response
+            except IntegrityError:
+                # Another request with this key committed while we waited on the constraint.
+                record = IdempotencyKey.objects.filter(**lookup).first()
+                if record is None:
+                    raise
+                logger.info(f"Replaying {scope} response for idempotency key {key}")
+                return _replay(record, fingerprint)
+
+            return response
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,117 @@
+import logging
+import random
+
+from django.db import transaction
+from django.db.models import F, Sum
+
+from .models import Stock, StockShard
+
+logger = logging.getLogger(__name__)
+
+
+class InsufficientStock(Exception):
+    """Raised by `reserve` when a product cannot cover the requested units."""
+
+    def __init__(self, product_id):
+        self.product_id = product_id
+        super().__init__(f"Insufficient stock for product {product_id}")
+
+
+def reserve(quantities):
+    """
+    Take units out of stock for an order being placed.
+
+    `quantities` maps product id to units. Each tracked product is decremented
+    with a single conditional `UPDATE ... SET available = available - n
+    WHERE available >= n`; no row is read or locked beforehand. Products
+    without a `Stock` row are untracked and always succeed.
+
+    Must be called inside the transaction that records the order: the stock
+    is committed with it, and rolled back with it. The row lock taken by
+    each UPDATE is held until commit, so call this as late in the
+    transaction as possible. Products are processed in id order so two
+    multi-product orders cannot deadlock each other.
+
+    Raises `InsufficientStock` for the first product that falls short; the
+    caller must let the transaction roll back, which restores any units
+    already taken.
+    """
+    if not transaction.get_connection().in_atomic_block:
+        raise RuntimeError("reserve() must run inside transaction.atomic().")
+
+    tracked = Stock.objects.filter(product_id__in=quantities).values_list('product_id', 'id', 'shard_count')
+    for product_id, stock_id, shard_count in sorted(tracked):
+        units = quantities[product_id]
+        if units <= 0:
+            continue
+        if shard_count:
+            taken = _take_from_shards(stock_id, shard_count, units)
+        else:
+            taken = Stock.objects.filter(pk=stock_id, available__gte=units) \
+                .update(available=F('available') - units)
+        if not taken:
+            raise InsufficientStock(product_id)
+
+
+def _take_from_shards(stock_id, shard_count, units):
+    # Fast path: one conditional UPDATE on a random shard, so concurrent
+    # orders for the same product mostly touch different rows.
+    for index in random.sample(range(shard_count), shard_count):
+        updated = StockShard.objects.filter(stock_id=stock_id, index=index, available__gte=units) \
+            .update(available=F('available') - units)
+        if updated:
+            return True
+
+    # No single shard covers the order, which only happens close to selling
+    # out: lock every shard (in index order) and split the units across them.
+    shards = list(StockShard.objects.select_for_update().filter(stock_id=stock_id).order_by('index'))
+    if sum(shard.available for shard in shards) < units:
+        return False
+    remaining = units
+    for shard in shards:
+        take = min(shard.available, remaining)
+        shard.available -= take
+        remaining -= take
+    StockShard.objects.bulk_update(shards, ['available'])
+    return True
+
+
+def set_stock(product, available, shards=0):
+    """
+    Set the units available for `product`, starting to track it if needed.
+
+    With `shards` > 0 the units are spread evenly over that many
+    `StockShard` rows; use it only for products hot enough that a single
+    counter row becomes a bottleneck.
+    """
+    with transaction.atomic():
+        stock, _ = Stock.objects.select_for_update().get_or_create(product=product)
+        stock.shards.all().delete()
+        if shards:
+            base, extra = divmod(available, shards)
+            StockShard.objects.bulk_create([
+                StockShard(stock=stock, index=index, available=base + (1 if index < extra else 0))
+                for index in range(shards)
+            ])
+            stock.available = 0
+        else:
+            stock.available = available
+        stock.shard_count = shards
+        stock.save(update_fields=['available', 'shard_count', 'updated_at'])
+    logger.info(f"Stock for product {product.pk} set to {available} ({shards} shard(s))")
+    return stock
+
+
+def stock_levels(product_ids):
+    """Map each tracked product id in `product_ids` to its available units."""
+    levels = dict(
+        Stock.objects.filter(product_id__in=product_ids, shard_count=0)
+        .values_list('product_id', 'available')
+    )
+    levels.update(
+        StockShard.objects.filter(stock__product_id__in=product_ids, stock__shard_count__gt=0)
+        .values('stock__product_id')
+        .annotate(total=Sum('available'))
+        .values_list('stock__product_id', 'total')
+    )
+    return levels
@@ -0,0 +1,116 @@
+import logging
+import random
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from django.utils.module_loading import autodiscover_modules
+
+from .models import Job
+
+logger = logging.getLogger(__name__)
+
+_handlers = {}
+
+
+def register_job(name):
+    """
+    Register the decorated function as the handler for jobs called `name`.
+
+    Handlers take the job payload as keyword arguments. They live in each
+    app's `tasks` module, which the worker imports on start-up.
+    """
+
+    def decorator(func):
+        _handlers[name] = func
+        return func
+
+    return decorator
+
+
+def load_handlers():
+    autodiscover_modules('tasks')
+    return _handlers
+
+
+def enqueue(name, payload=None, delay=0, max_attempts=5):
+    """
+    Queue a job for the worker.
+
+    The row is written through the current connection, so inside
+    `transaction.atomic()` the job only becomes visible to workers when the
+    surrounding transaction commits, and disappears with it on rollback.
+    Side effects such as emails therefore never fire for work that was not
+    saved. The payload must be JSON serializable.
+    """
+    return Job.objects.create(
+        name=name,
+        payload=payload or {},
+        max_attempts=max_attempts,
+        run_at=timezone.now() + timedelta(seconds=delay),
+    )
+
+
+def claim_jobs(worker_id, limit=1):
+    """
+    Mark up to `limit` due jobs as running for `worker_id` and return them.
+
+    Candidates are selected with `FOR UPDATE SKIP LOCKED`, so concurrent
+    workers never wait on each other or claim the same job.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        ids = list(
+            Job.objects.select_for_update(skip_locked=True)
+            .filter(status='queued', run_at__lte=now)
+            .order_by('run_at', 'id')
+            .values_list('id', flat=True)[:limit]
+        )
+        if not ids:
+            return []
+        Job.objects.filter(id__in=ids).update(
+            status='running', locked_at=now, locked_by=worker_id, attempts=F('attempts') + 1
+        )
+    return list(Job.objects.filter(id__in=ids).order_by('run_at', 'id'))
+
+
+def retry_delay(attempts):
+    """Exponential backoff with jitter: RETRY_BACKOFF * 2^(attempts-1), capped at MAX_RETRY_DELAY."""
+    config = settings.JOBS
+    delay = min(config['RETRY_BACKOFF'] * 2 ** (attempts - 1), config['MAX_RETRY_DELAY'])
+    return delay * random.uniform(0.8, 1.2)
+
+
+def run_job(job):
+    """Run a claimed job: delete it on success, otherwise reschedule it or mark it failed."""
+    handler = _handlers.get(job.name)
+    try:
+        if handler is None:
+            raise LookupError(f"No handler registered for job '{job.name}'")
+        handler(**job.payload)
+    except Exception:
+        error = traceback.format_exc()
+        if job.attempts >= job.max_attempts:
+            logger.error(f"Job {job} failed after {job.attempts} attempt(s)", extra={'data': error})
+            Job.objects.filter(pk=job.pk).update(status='failed', locked_at=None, last_error=error)
+        else:
+            run_at = timezone.now() + timedelta(seconds=retry_delay(job.attempts))
+            logger.warning(f"Job {job} failed, retrying at {run_at.isoformat()}")
+            Job.objects.filter(pk=job.pk).update(
+                status='queued', locked_at=None, locked_by='', run_at=run_at, last_error=error
+            )
+        return False
+
+    Job.objects.filter(pk=job.pk).delete()
+    return True
+
+
+def requeue_stale_jobs():
+    """Put back jobs whose worker died mid-run (locked longer than LOCK_TIMEOUT)."""
+    cutoff = timezone.now() - timedelta(seconds=settings.JOBS['LOCK_TIMEOUT'])
+    return Job.objects.filter(status='running', locked_at__lt=cutoff).update(
+        status='queued', locked_at=None, locked_by=''
+    )
@@ -0,0 +1,58 @@
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.db.models import Count, DecimalField, F, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+from core_app.models import Order, OrderItem
+
+
+class Command(BaseCommand):
+    """
+    Backfill or verify the stored `total_amount` and `items_count` on orders.
+
+    Both columns are written by `PlaceOrderView` when an order is placed and
+    served as-is by the order listings. Totals are recomputed from the
+    `OrderItem.price` snapshots, never from current product prices.
+
+    Usage:
+    - python manage.py backfill_order_totals
+    - python manage.py backfill_order_totals --verify
+    """
+
+    help = "Recompute stored order totals and item counts from order items."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--verify',
+            action='store_true',
+            help="Only report orders whose stored totals or item counts are wrong.",
+        )
+
+    def handle(self, *args, **options):
+        items = OrderItem.objects.filter(order=OuterRef('pk')).order_by().values('order')
+        total = Coalesce(
+            Subquery(items.annotate(total=Sum(F('quantity') * F('price'))).values('total')),
+            Decimal('0.00'),
+            output_field=DecimalField(max_digits=10, decimal_places=2),
+        )
+        count = Coalesce(Subquery(items.annotate(count=Count('pk')).values('count')), 0)
+
+        if options['verify']:
+            mismatched = (
+                Order.objects.annotate(expected_total=total, expected_count=count)
+                .exclude(total_amount=F('expected_total'), items_count=F('expected_count'))
+                .values_list('id', 'total_amount', 'expected_total', 'items_count', 'expected_count')
+            )
+            found = 0
+            for order_id, stored_total, expected_total, stored_count, expected_count in mismatched.iterator():
+                found += 1
+                self.stdout.write(
+                    f"Order {order_id}: total {stored_total} (expected {expected_total}), "
+                    f"items {stored_count} (expected {expected_count})"
+                )
+            self.stdout.write(f"{found} order(s) out of sync")
+            return
+
+        updated = Order.objects.update(total_amount=total, items_count=count)
+        self.stdout.write(self.style.SUCCESS(f"Backfilled totals for {updated} order(s)"))
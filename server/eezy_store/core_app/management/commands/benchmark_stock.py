@@ -0,0 +1,112 @@
+import threading
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.utils import OperationalError
+
+from core_app.inventory import InsufficientStock, reserve, set_stock, stock_levels
+from core_app.models import Order, OrderItem, Product
+
+
+class Command(BaseCommand):
+    """
+    Measure order throughput when many clients buy the same product at once.
+
+    Each thread repeatedly runs the same transaction as `PlaceOrderView`
+    (create the order and its item, then reserve stock) against a single
+    throwaway product, and the run reports orders per second plus a check
+    that no unit was oversold. Compare `--shards 0` with e.g. `--shards 8`
+    to see the effect of the sharded counter under contention.
+
+    Writes to the configured database; run it against PostgreSQL, as
+    SQLite serializes all writers. The product and user it creates are
+    deleted afterwards unless `--keep` is given.
+
+    Usage:
+    - python manage.py benchmark_stock
+    - python manage.py benchmark_stock --threads 32 --orders 5000 --stock 2000 --shards 8
+    """
+
+    help = "Benchmark concurrent stock reservation on one hot product."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=16, help="Concurrent buyers.")
+        parser.add_argument('--orders', type=int, default=2000, help="Total order attempts.")
+        parser.add_argument('--stock', type=int, default=1000, help="Units available at the start.")
+        parser.add_argument('--quantity', type=int, default=1, help="Units per order.")
+        parser.add_argument('--shards', type=int, default=0, help="Counter shards (0 = single row).")
+        parser.add_argument('--keep', action='store_true', help="Keep the benchmark product and orders.")
+
+    def handle(self, *args, **options):
+        threads, quantity = options['threads'], options['quantity']
+        user, created_user = User.objects.get_or_create(username='stock-benchmark')
+        product = Product.objects.create(name='Stock benchmark product', description='benchmark', price=1)
+        set_stock(product, options['stock'], shards=options['shards'])
+
+        counts = {'placed': 0, 'sold_out': 0, 'errors': 0}
+        lock = threading.Lock()
+        per_thread = [options['orders'] // threads + (1 if i < options['orders'] % threads else 0)
+                      for i in range(threads)]
+
+        def buyer(attempts):
+            try:
+                for _ in range(attempts):
+                    outcome = self.place_order(user, product, quantity)
+                    with lock:
+                        counts[outcome] += 1
+            finally:
+                connection.close()
+
+        workers = [threading.Thread(target=buyer, args=(attempts,)) for attempts in per_thread]
+        started = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - started
+
+        remaining = stock_levels([product.pk])[product.pk]
+        sold = counts['placed'] * quantity
+        attempts = sum(counts.values())
+        self.stdout.write(
+            f"{attempts} attempts by {threads} thread(s) in {elapsed:.2f}s "
+            f"({attempts / elapsed:.0f} attempts/s, {counts['placed'] / elapsed:.0f} orders/s)"
+        )
+        self.stdout.write(
+            f"placed={counts['placed']} sold_out={counts['sold_out']} errors={counts['errors']} "
+            f"remaining={remaining}"
+        )
+        if sold + remaining == options['stock']:
+            self.stdout.write(self.style.SUCCESS("Stock consistent: no units oversold or lost"))
+        else:
+            self.stdout.write(self.style.ERROR(
+                f"Stock inconsistent: sold {sold} + remaining {remaining} != {options['stock']}"
+            ))
+
+        if not options['keep']:
+            # Only this run's orders contain the product; an existing user keeps theirs.
+            Order.objects.filter(items__product=product).delete()
+            product.delete()
+            if created_user:
+                user.delete()
+
+    def place_order(self, user, product, quantity):
+        try:
+            with transaction.atomic():
+                order = Order.objects.create(
+                    user=user,
+                    total_amount=product.price * quantity,
+                    items_count=1,
+                )
+                OrderItem.objects.create(
+                    order=order, product=product, quantity=quantity, price=product.price,
+                    created_at=order.created_at,
+                )
+                reserve({product.pk: quantity})
+            return 'placed'
+        except InsufficientStock:
+            return 'sold_out'
+        except OperationalError:
+            return 'errors'
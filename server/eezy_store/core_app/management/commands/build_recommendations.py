@@ -0,0 +1,44 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core_app.recommendations import build_recommendations
+
+
+class Command(BaseCommand):
+    """
+    Rebuild the "frequently bought together" recommendations.
+
+    Counts how often every pair of products was ordered together, in
+    parallel over ranges of orders, and stores the best `--top-k`
+    neighbours of each product in `ProductRecommendation`. Memory per
+    worker is bounded by `--chunk-orders`; the merged pair counts are
+    sparse arrays in the parent. Run it nightly, e.g. from cron.
+
+    Usage:
+    - python manage.py build_recommendations
+    - python manage.py build_recommendations --workers 8 --top-k 20 --min-score 2
+    """
+
+    help = "Rebuild product recommendations from order history."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--top-k', type=int, default=10, help="Recommendations kept per product.")
+        parser.add_argument('--min-score', type=int, default=1, help="Minimum orders shared by a pair.")
+        parser.add_argument('--workers', type=int, help="Worker processes (default: one per CPU).")
+        parser.add_argument('--chunk-orders', type=int, default=50000, help="Orders counted per task.")
+
+    def handle(self, *args, **options):
+        if options['top_k'] < 1 or options['chunk_orders'] < 1:
+            raise CommandError("--top-k and --chunk-orders must be positive.")
+
+        started = time.monotonic()
+        written = build_recommendations(
+            top_k=options['top_k'],
+            min_score=options['min_score'],
+            workers=options['workers'],
+            chunk_orders=options['chunk_orders'],
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"Stored {written} recommendation(s) in {time.monotonic() - started:.1f}s"
+        ))
@@ -0,0 +1,68 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.utils import timezone
+
+from core_app.models import Order, OrderItem, OrderStatusHistory
+
+
+class Command(BaseCommand):
+    """
+    Report how the hot order queries use their indexes.
+
+    Prints the query plan of the admin order list (filtered by status and by
+    date range) and of a customer's order history, each in its keyset
+    order. On PostgreSQL it also lists every index on the order tables with
+    its scan count and size from `pg_stat_user_indexes`, so unused or
+    redundant indexes stand out.
+
+    Usage:
+    - python manage.py order_index_usage
+    - python manage.py order_index_usage --status shipped --user-id 42
+    """
+
+    help = "Show query plans and index statistics for the order tables."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--status', default='approved', help="Status used for the admin list query.")
+        parser.add_argument('--user-id', type=int, help="Customer used for the history query (default: any).")
+        parser.add_argument('--days', type=int, default=30, help="Date range used for the admin list query.")
+
+    def handle(self, *args, **options):
+        user_id = options['user_id'] or Order.objects.values_list('user_id', flat=True).first() or 0
+        since = timezone.now() - timedelta(days=options['days'])
+        ordering = ('-created_at', '-id')
+        queries = [
+            ("Admin orders by status", Order.objects.filter(status=options['status']).order_by(*ordering)[:26]),
+            ("Admin orders by date", Order.objects.filter(created_at__gte=since).order_by(*ordering)[:26]),
+            ("Customer order history", Order.objects.filter(user_id=user_id).order_by(*ordering)[:26]),
+        ]
+
+        for title, queryset in queries:
+            self.stdout.write(self.style.MIGRATE_HEADING(title))
+            self.stdout.write(queryset.explain())
+            self.stdout.write("")
+
+        if connection.vendor != 'postgresql':
+            self.stdout.write("Index statistics require PostgreSQL; showing query plans only.")
+            return
+
+        tables = [model._meta.db_table for model in (Order, OrderItem, OrderStatusHistory)]
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT relname, indexrelname, idx_scan, idx_tup_read, idx_tup_fetch,
+                       pg_size_pretty(pg_relation_size(indexrelid))
+                FROM pg_stat_user_indexes
+                WHERE relname = ANY(%s)
+                ORDER BY relname, idx_scan DESC
+                """,
+                [tables],
+            )
+            rows = cursor.fetchall()
+
+        self.stdout.write(self.style.MIGRATE_HEADING("Index usage since last statistics reset"))
+        for table, index, scans, tuples_read, tuples_fetched, size in rows:
+            line = f"{table}.{index}: {scans} scan(s), {tuples_read} read, {tuples_fetched} fetched, {size}"
+            self.stdout.write(self.style.WARNING(line + " (unused)") if not scans else line)
@@ -0,0 +1,219 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from core_app.models import OrderItem
+
+
+def month_start(day, offset=0):
+    month = day.year * 12 + day.month - 1 + offset
+    return date(month // 12, month % 12 + 1, 1)
+
+
+class Command(BaseCommand):
+    """
+    Manage monthly range partitions of the order items table on PostgreSQL.
+
+    Order items are partitioned by `created_at` (a copy of the order's
+    creation time), one partition per month plus a default partition that
+    catches anything outside the created ranges. Queries that filter on
+    `created_at`, such as the date-scoped top products report, only scan the
+    matching months.
+
+    Only `OrderItem` is partitioned. PostgreSQL requires the partition key to
+    be part of every unique key on a partitioned table, so partitioning
+    `Order` would need `(id, created_at)` as its primary key and break the
+    foreign keys pointing at it; nothing references `OrderItem`. The
+    partitioned table's primary key is `(id, created_at)`; ids still come
+    from a single sequence.
+
+    Actions:
+    - --convert: Turn the existing table into a partitioned one, copying all
+      rows. Takes an exclusive lock for the duration of the copy, so run it
+      in a maintenance window and after a backup.
+    - --create-ahead N: Create partitions from the current month through N
+      months ahead (default 3), moving any matching rows out of the default
+      partition. Run it monthly, e.g. from cron.
+    - --detach-before YYYY-MM: Detach partitions that end on or before that
+      month. Detached tables keep their data for archiving; add --drop to
+      delete them instead.
+    Without an action the current partitions are listed.
+
+    Usage:
+    - python manage.py partition_order_items --convert
+    - python manage.py partition_order_items --create-ahead 3
+    - python manage.py partition_order_items --detach-before 2024-01 --drop
+    """
+
+    help = "Create, convert and detach monthly partitions of the order items table."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--convert', action='store_true', help="Convert the table to a partitioned table.")
+        parser.add_argument('--create-ahead', type=int, metavar='N', help="Create partitions N months ahead.")
+        parser.add_argument('--detach-before', metavar='YYYY-MM', help="Detach partitions ending by this month.")
+        parser.add_argument('--drop', action='store_true', help="Drop partitions after detaching them.")
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError("Partitioning is only supported on PostgreSQL.")
+
+        self.table = OrderItem._meta.db_table
+        self.default_partition = f"{self.table}_default"
+
+        if options['convert']:
+            self.convert(ahead=options['create_ahead'] or 3)
+        elif options['create_ahead'] is not None:
+            self.require_partitioned()
+            self.create_ahead(options['create_ahead'])
+        if options['detach_before']:
+            self.require_partitioned()
+            self.detach_before(options['detach_before'], drop=options['drop'])
+
+        self.list_partitions()
+
+    def qn(self, name):
+        return connection.ops.quote_name(name)
+
+    def is_partitioned(self, cursor):
+        cursor.execute("SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)", [self.table])
+        row = cursor.fetchone()
+        return row is not None and row[0] == 'p'
+
+    def require_partitioned(self):
+        with connection.cursor() as cursor:
+            if not self.is_partitioned(cursor):
+                raise CommandError(f"{self.table} is not partitioned yet; run with --convert first.")
+
+    def partition_name(self, start):
+        return f"{self.table}_p{start:%Y%m}"
+
+    def partitions(self, cursor):
+        cursor.execute(
+            """
+            SELECT child.relname, child.reltuples::bigint
+            FROM pg_inherits
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE pg_inherits.inhparent = to_regclass(%s)
+            ORDER BY child.relname
+            """,
+            [self.table],
+        )
+        return cursor.fetchall()
+
+    def convert(self, ahead):
+        table, legacy = self.table, f"{self.table}_legacy"
+        sequence = f"{self.table}_id_seq"
+        with transaction.atomic(), connection.cursor() as cursor:
+            if self.is_partitioned(cursor):
+                raise CommandError(f"{table} is already partitioned.")
+
+            # Lock before reading anything from the table, so no order item
+            # can be written between these reads and the copy.
+            cursor.execute(f"LOCK TABLE {self.qn(table)} IN ACCESS EXCLUSIVE MODE")
+            cursor.execute(
+                "SELECT indexname, indexdef FROM pg_indexes WHERE tablename = %s AND indexname != %s",
+                [table, f"{table}_pkey"],
+            )
+            indexes = cursor.fetchall()
+            cursor.execute(
+                "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+                "WHERE conrelid = to_regclass(%s) AND contype = 'f'",
+                [table],
+            )
+            foreign_keys = cursor.fetchall()
+            cursor.execute(f"SELECT MIN(created_at) FROM {self.qn(table)}")
+            oldest = cursor.fetchone()[0]
+
+            cursor.execute(f"ALTER TABLE {self.qn(table)} RENAME TO {self.qn(legacy)}")
+            cursor.execute(
+                f"CREATE TABLE {self.qn(table)} (LIKE {self.qn(legacy)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+                f"PARTITION BY RANGE (created_at)"
+            )
+            cursor.execute(f"ALTER TABLE {self.qn(table)} ADD PRIMARY KEY (id, created_at)")
+
+            current = month_start(timezone.now().date())
+            start = month_start(oldest.date()) if oldest else current
+            while start <= month_start(current, ahead):
+                self.attach_partition(cursor, start)
+                start = month_start(start, 1)
+            cursor.execute(f"CREATE TABLE {self.qn(self.default_partition)} PARTITION OF {self.qn(table)} DEFAULT")
+
+            cursor.execute(f"INSERT INTO {self.qn(table)} SELECT * FROM {self.qn(legacy)}")
+            # Dropping the old table also drops its identity sequence, whose name is reused below.
+            cursor.execute(f"DROP TABLE {self.qn(legacy)}")
+            cursor.execute(f"CREATE SEQUENCE {self.qn(sequence)} OWNED BY {self.qn(table)}.id")
+            # Continue after the highest id actually copied.
+            cursor.execute(f"SELECT MAX(id) FROM {self.qn(table)}")
+            max_id = cursor.fetchone()[0]
+            cursor.execute("SELECT setval(%s, %s, false)", [sequence, (max_id or 0) + 1])
+            cursor.execute(f"ALTER TABLE {self.qn(table)} ALTER COLUMN id SET DEFAULT nextval(%s::regclass)", [sequence])
+
+            for name, definition in indexes:
+                method_and_columns = definition.split(' USING ', 1)[1]
+                cursor.execute(f"CREATE INDEX {self.qn(name)} ON {self.qn(table)} USING {method_and_columns}")
+            for name, definition in foreign_keys:
+                cursor.execute(f"ALTER TABLE {self.qn(table)} ADD CONSTRAINT {self.qn(name)} {definition}")
+
+        self.stdout.write(self.style.SUCCESS(f"Converted {table} to monthly partitions"))
+
+    def attach_partition(self, cursor, start):
+        """Create the partition for the month starting at `start`, moving its rows out of the default partition."""
+        name, end = self.partition_name(start), month_start(start, 1)
+        cursor.execute("SELECT to_regclass(%s)", [name])
+        if cursor.fetchone()[0] is not None:
+            return False
+
+        bounds = f"FROM ('{start.isoformat()} 00:00:00+00') TO ('{end.isoformat()} 00:00:00+00')"
+        cursor.execute(f"CREATE TABLE {self.qn(name)} (LIKE {self.qn(self.table)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)")
+        cursor.execute("SELECT to_regclass(%s)", [self.default_partition])
+        if cursor.fetchone()[0] is not None:
+            cursor.execute(
+                f"WITH moved AS (DELETE FROM {self.qn(self.default_partition)} "
+                f"WHERE created_at >= %s AND created_at < %s RETURNING *) "
+                f"INSERT INTO {self.qn(name)} SELECT * FROM moved",
+                [f"{start.isoformat()} 00:00:00+00", f"{end.isoformat()} 00:00:00+00"],
+            )
+        # ATTACH only needs SHARE UPDATE EXCLUSIVE on the parent, so order placement keeps running.
+        cursor.execute(f"ALTER TABLE {self.qn(self.table)} ATTACH PARTITION {self.qn(name)} FOR VALUES {bounds}")
+        self.stdout.write(f"Created partition {name}")
+        return True
+
+    def create_ahead(self, ahead):
+        current = month_start(timezone.now().date())
+        created = 0
+        for offset in range(ahead + 1):
+            with transaction.atomic(), connection.cursor() as cursor:
+                created += self.attach_partition(cursor, month_start(current, offset))
+        self.stdout.write(self.style.SUCCESS(f"Created {created} partition(s)"))
+
+    def detach_before(self, month, drop):
+        try:
+            year, month_number = (int(part) for part in month.split('-'))
+            cutoff = date(year, month_number, 1)
+        except ValueError:
+            raise CommandError("--detach-before must be in YYYY-MM format.")
+
+        with connection.cursor() as cursor:
+            names = [name for name, _ in self.partitions(cursor) if name != self.default_partition]
+        detached = 0
+        for name in names:
+            start = date(int(name[-6:-2]), int(name[-2:]), 1)
+            if month_start(start, 1) > cutoff:
+                continue
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute(f"ALTER TABLE {self.qn(self.table)} DETACH PARTITION {self.qn(name)}")
+                if drop:
+                    cursor.execute(f"DROP TABLE {self.qn(name)}")
+            detached += 1
+            self.stdout.write(f"{'Dropped' if drop else 'Detached'} partition {name}")
+        self.stdout.write(self.style.SUCCESS(f"{'Dropped' if drop else 'Detached'} {detached} partition(s)"))
+
+    def list_partitions(self):
+        with connection.cursor() as cursor:
+            if not self.is_partitioned(cursor):
+                self.stdout.write(f"{self.table} is not partitioned.")
+                return
+            for name, estimated_rows in self.partitions(cursor):
+                self.stdout.write(f"{name}: ~{max(estimated_rows, 0)} row(s)")
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from core_app.models import IdempotencyKey
+
+
+class Command(BaseCommand):
+    """
+    Delete expired `Idempotency-Key` records.
+
+    Expired keys are already ignored when a request arrives; this keeps the
+    table small. Schedule it periodically (e.g. hourly via cron).
+
+    Usage:
+    - python manage.py purge_idempotency_keys
+    """
+
+    help = "Delete idempotency keys past their expiry."
+
+    def handle(self, *args, **options):
+        deleted, _ = IdempotencyKey.objects.filter(expires_at__lte=timezone.now()).delete()
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} expired idempotency key(s)"))
@@ -0,0 +1,53 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, Sum
+
+from core_app.models import Product, Rating
+
+
+class Command(BaseCommand):
+    """
+    Recompute the stored rating aggregates on every product.
+
+    `Product.add_rating` keeps `rating_count`, `rating_sum` and `average_rating`
+    current as ratings come in. Ratings edited or removed through the Django
+    admin or the shell bypass that path, so this command repairs the columns
+    from the `Rating` table.
+
+    Usage:
+    - python manage.py rebuild_product_ratings
+    - python manage.py rebuild_product_ratings --check
+    """
+
+    help = "Recompute stored product rating aggregates from the Rating table."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help="Only report products whose stored aggregates have drifted.",
+        )
+
+    def handle(self, *args, **options):
+        if options['check']:
+            drifted = self.find_drift()
+            for product_id in drifted:
+                self.stdout.write(f"Product {product_id} has stale rating aggregates")
+            self.stdout.write(f"{len(drifted)} product(s) out of sync")
+            return
+
+        updated = Product.objects.all().refresh_ratings()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt rating aggregates for {updated} product(s)"))
+
+    def find_drift(self):
+        actual = {
+            row['product']: row
+            for row in Rating.objects.order_by().values('product').annotate(
+                count=Count('pk'), total=Sum('score'))
+        }
+        drifted = []
+        stored = Product.objects.values_list('id', 'rating_count', 'rating_sum').iterator(chunk_size=2000)
+        for product_id, rating_count, rating_sum in stored:
+            row = actual.get(product_id, {'count': 0, 'total': 0})
+            if (rating_count, rating_sum) != (row['count'], row['total'] or 0):
+                drifted.append(product_id)
+        return drifted
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from core_app.rollups import rebuild_buyer_sketches, rebuild_product_sales, rebuild_sales_buckets
+
+
+class Command(BaseCommand):
+    """
+    Rebuild the sales rollups from the orders and order items.
+
+    `PlaceOrderView` keeps `ProductSales`, `ProductSalesDaily`, the
+    `SalesBucket` time series and (through a background job) the
+    `BuyerSketch` unique buyer counts current as orders are placed (status
+    changes update the buckets too); this backfills them (e.g. after the tables are first
+    created) or repairs drift. Run it when order traffic is low.
+
+    Usage:
+    - python manage.py rebuild_sales_rollups
+    """
+
+    help = "Recompute sales rollups from orders and order items."
+
+    def handle(self, *args, **options):
+        products = rebuild_product_sales()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt sales rollups for {products} product(s)"))
+        buckets = rebuild_sales_buckets()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {buckets} sales bucket(s)"))
+        sketches = rebuild_buyer_sketches()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {sketches} buyer sketch(es)"))
@@ -0,0 +1,96 @@
+import os
+import signal
+import socket
+import threading
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import DatabaseError, connection
+
+from core_app.jobs import claim_jobs, load_handlers, requeue_stale_jobs, run_job
+
+
+class Command(BaseCommand):
+    """
+    Run queued background jobs (see core_app.jobs).
+
+    Starts `--concurrency` worker threads, each claiming due jobs with
+    `SELECT ... FOR UPDATE SKIP LOCKED`, so any number of these processes
+    can run side by side. Failed jobs are retried with exponential backoff
+    up to their `max_attempts`; jobs left running by a crashed worker are
+    requeued after `JOBS['LOCK_TIMEOUT']`. Stops cleanly on SIGINT/SIGTERM
+    once the jobs in hand have finished.
+
+    Usage:
+    - python manage.py run_jobs
+    - python manage.py run_jobs --concurrency 4
+    - python manage.py run_jobs --once
+    """
+
+    help = "Process background jobs."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--concurrency', type=int, default=2, help="Worker threads.")
+        parser.add_argument('--batch-size', type=int, default=1, help="Jobs claimed per poll by each thread.")
+        parser.add_argument('--once', action='store_true', help="Exit once no jobs are due.")
+
+    def handle(self, *args, **options):
+        handlers = load_handlers()
+        self.stdout.write(f"Registered jobs: {', '.join(sorted(handlers)) or 'none'}")
+
+        stop = threading.Event()
+        if not options['once']:
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                signal.signal(sig, lambda *_: stop.set())
+
+        requeued = requeue_stale_jobs()
+        if requeued:
+            self.stdout.write(f"Requeued {requeued} stale job(s)")
+
+        prefix = f"{socket.gethostname()}:{os.getpid()}"
+        threads = [
+            threading.Thread(
+                target=self.work,
+                args=(f"{prefix}:{index}", options['batch_size'], options['once'], stop),
+                daemon=True,
+            )
+            for index in range(options['concurrency'])
+        ]
+        for thread in threads:
+            thread.start()
+
+        last_sweep = time.monotonic()
+        while any(thread.is_alive() for thread in threads):
+            if stop.wait(timeout=settings.JOBS['POLL_INTERVAL']):
+                break
+            if time.monotonic() - last_sweep >= settings.JOBS['LOCK_TIMEOUT']:
+                requeue_stale_jobs()
+                connection.close()
+                last_sweep = time.monotonic()
+        for thread in threads:
+            thread.join()
+        self.stdout.write("Worker stopped")
+
+    def work(self, worker_id, batch_size, once, stop):
+        poll_interval = settings.JOBS['POLL_INTERVAL']
+        try:
+            while not stop.is_set():
+                try:
+                    jobs = claim_jobs(worker_id, limit=batch_size)
+                except DatabaseError as e:
+                    # Connection dropped or database unavailable: back off and reconnect.
+                    self.stderr.write(f"[{worker_id}] could not claim jobs: {e}")
+                    connection.close()
+                    stop.wait(timeout=poll_interval)
+                    continue
+                if not jobs:
+                    if once:
+                        return
+                    stop.wait(timeout=poll_interval)
+                    continue
+                for job in jobs:
+                    succeeded = run_job(job)
+                    self.stdout.write(f"[{worker_id}] {job.name} #{job.pk}: {'done' if succeeded else 'failed'}")
+        finally:
+            connection.close()
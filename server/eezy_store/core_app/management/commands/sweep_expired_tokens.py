@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand
+
+from core_app.jobs import enqueue
+from core_app.models import Job
+from core_app.tokens import sweep_expired_tokens
+
+
+class Command(BaseCommand):
+    """
+    Delete expired JWT refresh tokens from the blacklist tables.
+
+    simplejwt records every issued refresh token in `OutstandingToken` and
+    every logout in `BlacklistedToken`, and never removes them. This deletes
+    the expired ones in small batches (`TOKEN_BLACKLIST['SWEEP_CHUNK_SIZE']`
+    per transaction), so it can run at any time.
+
+    With --schedule it instead queues the `sweep_expired_tokens` job, which
+    sweeps and requeues itself every `TOKEN_BLACKLIST['SWEEP_INTERVAL']`
+    seconds on the `run_jobs` worker. Running it again is harmless.
+
+    Usage:
+    - python manage.py sweep_expired_tokens
+    - python manage.py sweep_expired_tokens --schedule
+    """
+
+    help = "Delete expired outstanding and blacklisted tokens."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--schedule', action='store_true', help="Queue the recurring sweep job instead.")
+        parser.add_argument('--chunk-size', type=int, help="Tokens deleted per transaction.")
+
+    def handle(self, *args, **options):
+        if options['schedule']:
+            if Job.objects.filter(name='sweep_expired_tokens').exclude(status='failed').exists():
+                self.stdout.write("The token sweep job is already scheduled")
+            else:
+                enqueue('sweep_expired_tokens')
+                self.stdout.write(self.style.SUCCESS("Scheduled the token sweep job"))
+            return
+
+        deleted = sweep_expired_tokens(chunk_size=options['chunk_size'])
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} expired token(s)"))
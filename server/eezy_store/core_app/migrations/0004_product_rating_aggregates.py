@@ -0,0 +1,44 @@
+# Generated by Django 5.2 on 2026-10-18 08:45
+
+from decimal import Decimal
+from django.db import migrations, models
+from django.db.models import Avg, Count, Sum
+
+
+def backfill_rating_aggregates(apps, schema_editor):
+    Product = apps.get_model('core_app', 'Product')
+    Rating = apps.get_model('core_app', 'Rating')
+    aggregates = Rating.objects.order_by().values('product').annotate(
+        count=Count('pk'), total=Sum('score'), avg=Avg('score'))
+    for row in aggregates.iterator():
+        Product.objects.filter(pk=row['product']).update(
+            rating_count=row['count'],
+            rating_sum=row['total'],
+            average_rating=round(Decimal(str(row['avg'])), 2),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core_app', '0004_baseline_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='product',
+            name='average_rating',
+            field=models.DecimalField(decimal_places=2, default=Decimal('0'), max_digits=3),
+        ),
+        migrations.AddField(
+            model_name='product',
+            name='rating_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='product',
+            name='rating_sum',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_rating_aggregates, migrations.RunPython.noop),
+    ]
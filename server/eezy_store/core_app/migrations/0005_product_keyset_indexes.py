@@ -0,0 +1,25 @@
+# Generated by Django 5.2 on 2026-10-18 08:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core_app', '0004_product_rating_aggregates'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['is_deleted', 'created_at', 'id'], name='core_app_pr_is_dele_b12a59_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['is_deleted', 'price', 'id'], name='core_app_pr_is_dele_10314f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['is_deleted', 'average_rating', 'id'], name='core_app_pr_is_dele_b5262e_idx'),
+        ),
+    ]
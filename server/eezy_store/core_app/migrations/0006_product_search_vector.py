@@ -0,0 +1,75 @@
+# Generated by Django 5.2 on 2026-10-18 08:46
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+# Full-text search only exists on PostgreSQL. Other backends (the SQLite test
+# database) get the plain column and fall back to core_app.search.InvertedIndex.
+
+SEARCH_INDEX = django.contrib.postgres.indexes.GinIndex(
+    fields=['search_vector'], name='core_app_pr_search__2a7329_gin')
+
+SEARCH_VECTOR_SQL = """
+    setweight(to_tsvector('english', coalesce({row}name, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce({row}description, '')), 'B')
+"""
+
+CREATE_TRIGGER_SQL = """
+CREATE OR REPLACE FUNCTION core_app_product_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector := {vector};
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER core_app_product_search_vector_trigger
+BEFORE INSERT OR UPDATE OF name, description ON core_app_product
+FOR EACH ROW EXECUTE FUNCTION core_app_product_search_vector_update();
+
+UPDATE core_app_product SET search_vector = {backfill};
+""".format(vector=SEARCH_VECTOR_SQL.format(row='NEW.'), backfill=SEARCH_VECTOR_SQL.format(row=''))
+
+DROP_TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS core_app_product_search_vector_trigger ON core_app_product;
+DROP FUNCTION IF EXISTS core_app_product_search_vector_update();
+"""
+
+
+def create_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    Product = apps.get_model('core_app', 'Product')
+    schema_editor.add_index(Product, SEARCH_INDEX)
+    schema_editor.execute(CREATE_TRIGGER_SQL)
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    Product = apps.get_model('core_app', 'Product')
+    schema_editor.execute(DROP_TRIGGER_SQL)
+    schema_editor.remove_index(Product, SEARCH_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core_app', '0005_product_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='product',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(model_name='product', index=SEARCH_INDEX),
+            ],
+            database_operations=[
+                migrations.RunPython(create_search_index, drop_search_index),
+            ],
+        ),
+    ]
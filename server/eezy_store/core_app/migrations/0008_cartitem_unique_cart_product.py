@@ -0,0 +1,31 @@
+# Generated by Django 5.2 on 2026-10-18 08:49
+
+from django.db import migrations, models
+from django.db.models import Count, Min, Sum
+
+
+def merge_duplicate_cart_items(apps, schema_editor):
+    CartItem = apps.get_model('core_app', 'CartItem')
+    duplicates = (
+        CartItem.objects.order_by().values('cart', 'product')
+        .annotate(rows=Count('id'), keep=Min('id'), quantity=Sum('quantity'))
+        .filter(rows__gt=1)
+    )
+    for row in duplicates.iterator():
+        CartItem.objects.filter(pk=row['keep']).update(quantity=row['quantity'])
+        CartItem.objects.filter(cart=row['cart'], product=row['product']).exclude(pk=row['keep']).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core_app', '0007_cartitem_updated_at'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_cart_items, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='cartitem',
+            constraint=models.UniqueConstraint(fields=('cart', 'product'), name='unique_cart_product'),
+        ),
+    ]
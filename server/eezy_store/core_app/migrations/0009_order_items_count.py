@@ -0,0 +1,31 @@
+# Generated by Django 5.2 on 2026-10-18 08:51
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_items_count(apps, schema_editor):
+    Order = apps.get_model('core_app', 'Order')
+    OrderItem = apps.get_model('core_app', 'OrderItem')
+    counts = (
+        OrderItem.objects.filter(order=OuterRef('pk')).order_by().values('order')
+        .annotate(count=Count('pk')).values('count')
+    )
+    Order.objects.update(items_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core_app', '0008_cartitem_unique_cart_product'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='order',
+            name='items_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_items_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2 on 2026-10-18 08:59
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core_app', '0012_job'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OrderStatusHistory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('from_status', models.CharField(blank=True, choices=[('approved', 'Approved'), ('shipped', 'Shipped'), ('delivered', 'Delivered')], max_length=20)),
+                ('to_status', models.CharField(choices=[('approved', 'Approved'), ('shipped', 'Shipped'), ('delivered', 'Delivered')], max_length=20)),
+                ('changed_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('changed_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('order', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='status_history', to='core_app.order')),
+            ],
+            options={
+                'verbose_name': 'Order Status History',
+                'verbose_name_plural': 'Order Status History',
+                'ordering': ['-changed_at'],
+                'indexes': [models.Index(fields=['order', 'changed_at'], name='core_app_or_order_i_0c6f55_idx')],
+            },
+        ),
+    ]
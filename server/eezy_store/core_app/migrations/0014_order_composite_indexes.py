@@ -0,0 +1,31 @@
+# Generated by Django 5.2 on 2026-10-18 09:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core_app', '0013_order_status_history'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='order',
+            name='core_app_or_user_id_813343_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='order',
+            name='core_app_or_status_986561_idx',
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['status', 'created_at', 'id'], name='core_app_or_status_5604c4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['user', 'created_at', 'id'], name='core_app_or_user_id_1d3bdf_idx'),
+        ),
+    ]
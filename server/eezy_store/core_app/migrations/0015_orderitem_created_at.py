@@ -0,0 +1,37 @@
+# Generated by Django 5.2 on 2026-10-18 09:00
+
+import django.utils.timezone
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_created_at(apps, schema_editor):
+    Order = apps.get_model('core_app', 'Order')
+    OrderItem = apps.get_model('core_app', 'OrderItem')
+    OrderItem.objects.update(
+        created_at=Subquery(Order.objects.filter(pk=OuterRef('order_id')).values('created_at')[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core_app', '0014_order_composite_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='orderitem',
+            options={'ordering': ['-created_at'], 'verbose_name': 'Order Item', 'verbose_name_plural': 'Order Items'},
+        ),
+        migrations.AddField(
+            model_name='orderitem',
+            name='created_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.RunPython(backfill_created_at, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='orderitem',
+            index=models.Index(fields=['created_at'], name='core_app_or_created_67a949_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2 on 2026-10-18 09:08
+
+from decimal import Decimal
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core_app', '0016_product_sales_rollups'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SalesBucket',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('span', models.CharField(choices=[('hour', 'Hour'), ('day', 'Day')], max_length=4)),
+                ('start', models.DateTimeField()),
+                ('status', models.CharField(choices=[('approved', 'Approved'), ('shipped', 'Shipped'), ('delivered', 'Delivered')], max_length=20)),
+                ('shard', models.PositiveSmallIntegerField(default=0)),
+                ('orders', models.IntegerField(default=0)),
+                ('revenue', models.DecimalField(decimal_places=2, default=Decimal('0'), max_digits=14)),
+            ],
+            options={
+                'verbose_name': 'Sales Bucket',
+                'verbose_name_plural': 'Sales Buckets',
+                'constraints': [models.UniqueConstraint(fields=('span', 'start', 'status', 'shard'), name='unique_sales_bucket')],
+            },
+        ),
+    ]
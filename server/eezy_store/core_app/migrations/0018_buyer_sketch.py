@@ -0,0 +1,28 @@
+# Generated by Django 5.2 on 2026-10-18 09:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core_app', '0017_sales_bucket'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BuyerSketch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('registers', models.BinaryField()),
+                ('product', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='buyer_sketches', to='core_app.product')),
+            ],
+            options={
+                'verbose_name': 'Buyer Sketch',
+                'verbose_name_plural': 'Buyer Sketches',
+                'constraints': [models.UniqueConstraint(condition=models.Q(('product__isnull', False)), fields=('product', 'day'), name='unique_product_buyer_sketch'), models.UniqueConstraint(condition=models.Q(('product__isnull', True)), fields=('day',), name='unique_store_buyer_sketch')],
+            },
+        ),
+    ]
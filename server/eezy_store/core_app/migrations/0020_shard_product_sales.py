@@ -0,0 +1,41 @@
+# Generated by Django 5.2 on 2026-10-18 09:33
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core_app', '0019_product_recommendation'),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='productsalesdaily',
+            name='unique_product_sales_day',
+        ),
+        migrations.AddField(
+            model_name='productsales',
+            name='shard',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='productsalesdaily',
+            name='shard',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='productsales',
+            name='product',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sales', to='core_app.product'),
+        ),
+        migrations.AddConstraint(
+            model_name='productsales',
+            constraint=models.UniqueConstraint(fields=('product', 'shard'), name='unique_product_sales_shard'),
+        ),
+        migrations.AddConstraint(
+            model_name='productsalesdaily',
+            constraint=models.UniqueConstraint(fields=('product', 'day', 'shard'), name='unique_product_sales_day'),
+        ),
+    ]
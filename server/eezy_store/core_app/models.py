@@ -1,11 +1,19 @@
 from django.contrib.auth.models import User
 from django.db import models
-from django.db import transaction
-from django.db.models import Avg, Count
+from django.db import connections, transaction
+from django.db.models import Avg, Count, Sum, F, Q, OuterRef, Subquery, DecimalField, FloatField
+from django.db.models.functions import Cast, Coalesce, Now
 from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
 from decimal import Decimal
+import random
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from cloudinary.models import CloudinaryField
 
+from .hll import HyperLogLog
+
 # Create your models here.
 
 class Address(models.Model):
@@ -34,22 +42,32 @@ class Address(models.Model):
 
 
 class ProductQuerySet(models.QuerySet):
-    def with_ratings(self):
-        return self.annotate(
-            average_rating=Avg('ratings__score'),
-            rating_count=Count('ratings')
-        )
-
     def active(self):
         return self.filter(is_deleted=False)
 
+    def refresh_ratings(self):
+        """
+        Recompute the stored rating aggregates from the `Rating` table.
+
+        Runs as a single UPDATE with correlated subqueries, so it can repair
+        any drift left behind by ratings changed outside `Product.add_rating`.
+        """
+        ratings = Rating.objects.filter(product=OuterRef('pk')).order_by().values('product')
+        return self.update(
+            rating_count=Coalesce(Subquery(ratings.annotate(total=Count('pk')).values('total')), 0),
+            rating_sum=Coalesce(Subquery(ratings.annotate(total=Sum('score')).values('total')), 0),
+            average_rating=Coalesce(
+                Subquery(ratings.annotate(avg=Avg('score')).values('avg'),
+                         output_field=DecimalField(max_digits=3, decimal_places=2)),
+                Decimal('0'),
+            ),
+            updated_at=Now(),
+        )
+
 class ProductManager(models.Manager):
     def get_queryset(self):
         return ProductQuerySet(self.model, using=self._db)
 
-    def with_ratings(self):
-        return self.get_queryset().with_ratings()
-
     def active(self):
         return self.get_queryset().active()
 
@@ -60,6 +78,11 @@ class Product(models.Model):
     price = models.DecimalField(max_digits=10, decimal_places=2)
     image = CloudinaryField('products', blank=True)
     is_deleted = models.BooleanField(default=False)
+    average_rating = models.DecimalField(max_digits=3, decimal_places=2, default=Decimal('0'))
+    rating_count = models.PositiveIntegerField(default=0)
+    rating_sum = models.PositiveIntegerField(default=0)
+    # Maintained by a database trigger on PostgreSQL, see core_app.search.
+    search_vector = SearchVectorField(null=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -68,7 +91,12 @@ class Product(models.Model):
     class Meta:
         indexes = [
             models.Index(fields=['is_deleted']),
-            models.Index(fields=['created_at'])
+            models.Index(fields=['created_at']),
+            models.Index(fields=['is_deleted', 'created_at', 'id']),
+            models.Index(fields=['is_deleted', 'price', 'id']),
+            models.Index(fields=['is_deleted', 'average_rating', 'id']),
+            GinIndex(fields=['search_vector']),
+            models.Index(fields=['is_deleted', 'updated_at']),
         ]
     
     def __str__(self):
@@ -81,6 +109,26 @@ class Product(models.Model):
     def restore(self):
         self.is_deleted = False
         self.save()
+
+    def add_rating(self, user, score):
+        """
+        Create a rating and fold it into the stored aggregates atomically.
+
+        The counters are incremented with F() expressions in one UPDATE, so
+        concurrent ratings never lose an increment.
+        """
+        with transaction.atomic():
+            rating = Rating.objects.create(product=self, user=user, score=score)
+            Product.objects.filter(pk=self.pk).update(
+                rating_count=F('rating_count') + 1,
+                rating_sum=F('rating_sum') + score,
+                average_rating=Cast(
+                    Cast(F('rating_sum') + score, FloatField()) / (F('rating_count') + 1),
+                    output_field=DecimalField(max_digits=3, decimal_places=2),
+                ),
+                updated_at=Now(),
+            )
+        return rating
     
 class Rating(models.Model):
     product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='ratings')
@@ -99,6 +147,108 @@ class Rating(models.Model):
         return f"{self.user.username} rated {self.product.name} with {self.score}"
 
 
+class Stock(models.Model):
+    """
+    Units of a product available for sale.
+
+    Products without a `Stock` row are not tracked and never run out. With
+    `shard_count` set, the counter is split across `StockShard` rows so
+    concurrent orders for a very hot product update different rows; the
+    `available` column here is then unused. See core_app.inventory.
+    """
+    product = models.OneToOneField(Product, on_delete=models.CASCADE, related_name='stock')
+    available = models.PositiveIntegerField(default=0)
+    shard_count = models.PositiveSmallIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = 'Stock'
+        verbose_name_plural = 'Stock'
+
+    def __str__(self):
+        return f"Stock for {self.product.name}"
+
+    @property
+    def is_sharded(self):
+        return self.shard_count > 0
+
+
+class StockShard(models.Model):
+    stock = models.ForeignKey(Stock, on_delete=models.CASCADE, related_name='shards')
+    index = models.PositiveSmallIntegerField()
+    available = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = 'Stock Shard'
+        verbose_name_plural = 'Stock Shards'
+        constraints = [
+            models.UniqueConstraint(fields=['stock', 'index'], name='unique_stock_shard'),
+        ]
+
+    def __str__(self):
+        return f"Shard {self.index} of {self.stock}"
+
+
+class RollupManager(models.Manager):
+    """Manager for pre-aggregated counter tables that are only ever incremented."""
+
+    def increment(self, key_fields, rows):
+        """
+        Add `rows` to the stored counters in one statement.
+
+        Each row is a dict holding the `key_fields` (the table's unique key)
+        and the counter fields to add. Runs `INSERT ... ON CONFLICT (keys) DO
+        UPDATE SET counter = counter + EXCLUDED.counter`, so concurrent
+        writers never lose an increment. Rows are written in key order, so
+        transactions touching the same rows lock them in the same order.
+        """
+        if not rows:
+            return
+        connection = connections[self.db]
+        qn = connection.ops.quote_name
+        opts = self.model._meta
+        table = qn(opts.db_table)
+        fields = [opts.get_field(name) for name in rows[0]]
+        counters = [field for field in fields if field.name not in key_fields]
+        rows = sorted(rows, key=lambda row: tuple(row[name] for name in key_fields))
+
+        columns = ', '.join(qn(field.column) for field in fields)
+        values = ', '.join(['(' + ', '.join(['%s'] * len(fields)) + ')'] * len(rows))
+        conflict = ', '.join(qn(opts.get_field(name).column) for name in key_fields)
+        updates = ', '.join(
+            f"{qn(field.column)} = {table}.{qn(field.column)} + EXCLUDED.{qn(field.column)}"
+            for field in counters
+        )
+        params = [
+            field.get_db_prep_save(row[field.name], connection)
+            for row in rows
+            for field in fields
+        ]
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {table} ({columns}) VALUES {values} "
+                f"ON CONFLICT ({conflict}) DO UPDATE SET {updates}",
+                params,
+            )
+
+
+class ShardedRollupManager(RollupManager):
+    """
+    `RollupManager` for tables that spread each key's counters over `SHARDS` rows.
+
+    Every increment goes to one randomly picked `shard` row of its key, so
+    concurrent writers to a hot key (a best-selling product, the current
+    hour) rarely wait on the same row lock. Readers sum over the shards.
+    """
+
+    SHARDS = 8
+
+    def increment(self, key_fields, rows):
+        """Like `RollupManager.increment`, with `key_fields` excluding the shard."""
+        shard = random.randrange(self.SHARDS)
+        super().increment([*key_fields, 'shard'], [{**row, 'shard': shard} for row in rows])
+
+
 class Cart(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='cart')
     created_at = models.DateTimeField(auto_now_add=True)
@@ -118,15 +268,115 @@ class Cart(models.Model):
     def get_cart_items(self):
         return self.items.select_related('product').all()
     
+class CartItemManager(models.Manager):
+    def add_products(self, cart, quantities):
+        """
+        Add `{product_id: quantity}` to `cart` in a single statement.
+
+        Runs `INSERT ... SELECT ... ON CONFLICT (cart_id, product_id) DO UPDATE`
+        so existing rows are incremented in place and concurrent adds of the
+        same product can neither lose an increment nor create a duplicate row.
+        Only active products are inserted; the returned
+        `{product_id: (item_id, quantity)}` mapping omits any that are missing
+        or soft-deleted.
+        """
+        if not quantities:
+            return {}
+        connection = connections[self.db]
+        qn = connection.ops.quote_name
+        table = qn(self.model._meta.db_table)
+        product_table = qn(Product._meta.db_table)
+        product_ids = list(quantities)
+        quantity_cases = ' '.join(['WHEN %s THEN %s'] * len(product_ids))
+        placeholders = ', '.join(['%s'] * len(product_ids))
+        sql = (
+            f"INSERT INTO {table} (cart_id, product_id, quantity, updated_at) "
+            f"SELECT %s, p.id, CASE p.id {quantity_cases} END, %s "
+            f"FROM {product_table} p WHERE p.id IN ({placeholders}) AND p.is_deleted = %s "
+            f"ON CONFLICT (cart_id, product_id) DO UPDATE SET "
+            f"quantity = {table}.quantity + EXCLUDED.quantity, updated_at = EXCLUDED.updated_at "
+            f"RETURNING id, product_id, quantity"
+        )
+        params = [cart.pk]
+        for product_id in product_ids:
+            params += [product_id, quantities[product_id]]
+        params.append(connection.ops.adapt_datetimefield_value(timezone.now()))
+        params += product_ids
+        params.append(False)
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return {product_id: (item_id, quantity) for item_id, product_id, quantity in cursor.fetchall()}
+
+    def apply_operations(self, cart, operations):
+        """
+        Apply a batch of `add`/`set`/`remove` operations to `cart` atomically.
+
+        Operations are folded per product first (e.g. `set 2` then `add 1` is
+        `set 3`), then applied as one DELETE, one bulk upsert for absolute
+        quantities and one incrementing upsert for relative ones. Raises
+        `ValidationError` and rolls everything back if a product is missing
+        or a quantity would exceed `CartItem.MAX_QUANTITY`.
+        """
+        final = {}
+        for operation in operations:
+            product_id, quantity = operation['product_id'], operation.get('quantity', 0)
+            previous = final.get(product_id)
+            if operation['op'] == 'add' and previous is not None and previous[0] != 'remove':
+                final[product_id] = (previous[0], previous[1] + quantity)
+            elif operation['op'] == 'add' and previous is not None:
+                final[product_id] = ('set', quantity)
+            else:
+                final[product_id] = (operation['op'], quantity)
+
+        removes = [pid for pid, (op, _) in final.items() if op == 'remove']
+        sets = {pid: quantity for pid, (op, quantity) in final.items() if op == 'set'}
+        adds = {pid: quantity for pid, (op, quantity) in final.items() if op == 'add'}
+
+        too_many = sorted(pid for pid, quantity in {**sets, **adds}.items() if quantity > self.model.MAX_QUANTITY)
+        if too_many:
+            raise ValidationError(f"Max {self.model.MAX_QUANTITY} quantity allowed for products: {too_many}")
+
+        with transaction.atomic(using=self.db):
+            if removes:
+                self.filter(cart=cart, product_id__in=removes).delete()
+            if sets:
+                active = set(Product.objects.active().filter(pk__in=sets).values_list('pk', flat=True))
+                missing = sorted(set(sets) - active)
+                if missing:
+                    raise ValidationError(f"Products not found: {missing}")
+                self.bulk_create(
+                    [self.model(cart=cart, product_id=pid, quantity=quantity) for pid, quantity in sets.items()],
+                    update_conflicts=True,
+                    unique_fields=['cart', 'product'],
+                    update_fields=['quantity', 'updated_at'],
+                )
+            if adds:
+                added = self.add_products(cart, adds)
+                missing = sorted(set(adds) - set(added))
+                if missing:
+                    raise ValidationError(f"Products not found: {missing}")
+                too_many = sorted(pid for pid, (_, quantity) in added.items() if quantity > self.model.MAX_QUANTITY)
+                if too_many:
+                    raise ValidationError(f"Max {self.model.MAX_QUANTITY} quantity allowed for products: {too_many}")
+
+
 class CartItem(models.Model):
+    MAX_QUANTITY = 10
+
     cart = models.ForeignKey(Cart, on_delete=models.CASCADE, related_name='items')
     product = models.ForeignKey(Product, on_delete=models.CASCADE)
     quantity = models.PositiveIntegerField(default=1)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = CartItemManager()
 
     class Meta:
         verbose_name = 'Cart Item'
         verbose_name_plural = 'Cart Items'
         ordering = ['-cart__created_at']
+        constraints = [
+            models.UniqueConstraint(fields=['cart', 'product'], name='unique_cart_product'),
+        ]
         indexes = [
             models.Index(fields=['cart']),
             models.Index(fields=['product']),
@@ -136,27 +386,101 @@ class CartItem(models.Model):
         return f"{self.product.name} in {self.cart}"
 
 
+class OrderManager(models.Manager):
+    def transition_statuses(self, changes, changed_by=None):
+        """
+        Move many orders to new statuses at once.
+
+        `changes` maps order id to target status. The orders are locked and
+        read in one query, each change is checked against
+        `Order.ALLOWED_TRANSITIONS`, and the valid ones are applied with a
+        single `UPDATE ... WHERE id IN (...)` per target status. Every applied
+        change is recorded in `OrderStatusHistory` with one bulk insert.
+
+        Returns `{order_id: (outcome, from_status)}` where outcome is one of
+        `updated`, `unchanged`, `invalid_transition` or `not_found`.
+        The moved orders' counts and revenue are shifted between the status
+        columns of the `SalesBucket` rollups in the same transaction.
+        """
+        outcomes = {order_id: ('not_found', None) for order_id in changes}
+        by_target = {}
+        placed = {}
+
+        with transaction.atomic(using=self.db):
+            current = self.select_for_update().filter(pk__in=list(changes)) \
+                .values_list('pk', 'status', 'created_at', 'total_amount')
+            for order_id, from_status, created_at, total_amount in current:
+                placed[order_id] = (created_at, total_amount)
+                target = changes[order_id]
+                if target == from_status:
+                    outcomes[order_id] = ('unchanged', from_status)
+                elif target in self.model.ALLOWED_TRANSITIONS.get(from_status, ()):
+                    outcomes[order_id] = ('updated', from_status)
+                    by_target.setdefault(target, []).append(order_id)
+                else:
+                    outcomes[order_id] = ('invalid_transition', from_status)
+
+            now = timezone.now()
+            history = []
+            for target, order_ids in by_target.items():
+                self.filter(pk__in=order_ids).update(status=target, updated_at=now)
+                history.extend(
+                    OrderStatusHistory(
+                        order_id=order_id,
+                        from_status=outcomes[order_id][1],
+                        to_status=target,
+                        changed_by=changed_by,
+                        changed_at=now,
+                    )
+                    for order_id in order_ids
+                )
+            OrderStatusHistory.objects.bulk_create(history)
+
+            # Move each order's count and revenue between the status buckets.
+            moves = []
+            for target, order_ids in by_target.items():
+                for order_id in order_ids:
+                    created_at, total_amount = placed[order_id]
+                    moves.append((created_at, outcomes[order_id][1], -1, -total_amount))
+                    moves.append((created_at, target, 1, total_amount))
+            SalesBucket.objects.add_orders(moves)
+
+        return outcomes
+
+
 class Order(models.Model):
     STATUS_CHOICES = [
         ('approved', 'Approved'),
         ('shipped', 'Shipped'),
         ('delivered', 'Delivered'),
     ]
+
+    # Orders only move forward; `delivered` is final.
+    ALLOWED_TRANSITIONS = {
+        'approved': ('shipped', 'delivered'),
+        'shipped': ('delivered',),
+        'delivered': (),
+    }
  
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='orders')
     address = models.ForeignKey(Address, on_delete=models.SET_NULL, null=True)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='approved')
     total_amount = models.DecimalField(max_digits=10, decimal_places=2, default=0.0)
+    items_count = models.PositiveIntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = OrderManager()
+
     class Meta:
         verbose_name = 'Order'
         verbose_name_plural = 'Orders'
         ordering = ['-created_at']
+        # Composite indexes match the keyset ordering (-created_at, -id) of the
+        # admin list filtered by status and of each customer's order history.
         indexes = [
-            models.Index(fields=['user']),
-            models.Index(fields=['status']),
+            models.Index(fields=['status', 'created_at', 'id']),
+            models.Index(fields=['user', 'created_at', 'id']),
             models.Index(fields=['created_at']),
         ]
     
@@ -164,11 +488,14 @@ class Order(models.Model):
         return f"Order {self.id} by {self.user.username}"
     
     def calculate_total(self):
-        total = 0
-        items = self.items.select_related('product') 
-        for item in items:
-            total += item.quantity * item.product.price
-        return total
+        """
+        Recompute the total from the item price snapshots.
+
+        Listings read the stored `total_amount` and `items_count` written at
+        placement; this is for backfills and verification.
+        """
+        total = self.items.aggregate(total=Sum(F('quantity') * F('price')))['total']
+        return total if total is not None else Decimal('0.00')
 
     
 class OrderItem(models.Model):
@@ -176,16 +503,297 @@ class OrderItem(models.Model):
     product = models.ForeignKey(Product, on_delete=models.CASCADE)
     quantity = models.PositiveIntegerField(default=1)
     price = models.DecimalField(max_digits=10, decimal_places=2)
+    # Copy of the order's `created_at`; the partition key when order items are
+    # partitioned by month (see the `partition_order_items` command).
+    created_at = models.DateTimeField(default=timezone.now)
 
     class Meta:
         verbose_name = 'Order Item'
         verbose_name_plural = 'Order Items'
-        ordering = ['-order__created_at']
+        ordering = ['-created_at']
         indexes = [
             models.Index(fields=['order']),
-            models.Index(fields=['product'])
+            models.Index(fields=['product']),
+            models.Index(fields=['created_at']),
         ]
     
     def __str__(self):
         return f"{self.product.name} in {self.order}"
     
+
+
+class OrderStatusHistory(models.Model):
+    order = models.ForeignKey(Order, on_delete=models.CASCADE, related_name='status_history')
+    from_status = models.CharField(max_length=20, choices=Order.STATUS_CHOICES, blank=True)
+    to_status = models.CharField(max_length=20, choices=Order.STATUS_CHOICES)
+    changed_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='+')
+    changed_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        verbose_name = 'Order Status History'
+        verbose_name_plural = 'Order Status History'
+        ordering = ['-changed_at']
+        indexes = [
+            models.Index(fields=['order', 'changed_at']),
+        ]
+
+    def __str__(self):
+        return f"Order {self.order_id}: {self.from_status or '-'} -> {self.to_status}"
+
+
+class IdempotencyKey(models.Model):
+    """
+    Response recorded for a client-supplied `Idempotency-Key`.
+
+    Rows are created inside the transaction of the request they guard, so a
+    concurrent duplicate blocks on the unique constraint until the first
+    request commits, then replays its stored response. See core_app.idempotency.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='idempotency_keys')
+    scope = models.CharField(max_length=50)
+    key = models.CharField(max_length=255)
+    fingerprint = models.CharField(max_length=64)
+    status_code = models.PositiveSmallIntegerField(null=True, blank=True)
+    response_body = models.JSONField(null=True, blank=True, encoder=DjangoJSONEncoder)
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField()
+
+    class Meta:
+        verbose_name = 'Idempotency Key'
+        verbose_name_plural = 'Idempotency Keys'
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'scope', 'key'], name='unique_idempotency_key'),
+        ]
+        indexes = [
+            models.Index(fields=['expires_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.scope} {self.key} for {self.user.username}"
+
+
+class Job(models.Model):
+    """
+    A unit of background work, run by `manage.py run_jobs`. See core_app.jobs.
+
+    Finished jobs are deleted; jobs that exhaust their attempts stay behind
+    as `failed` with the last error for inspection.
+    """
+
+    STATUS_CHOICES = [
+        ('queued', 'Queued'),
+        ('running', 'Running'),
+        ('failed', 'Failed'),
+    ]
+
+    name = models.CharField(max_length=100)
+    payload = models.JSONField(default=dict, blank=True, encoder=DjangoJSONEncoder)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='queued')
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=5)
+    run_at = models.DateTimeField(default=timezone.now)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    locked_by = models.CharField(max_length=100, blank=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = 'Job'
+        verbose_name_plural = 'Jobs'
+        indexes = [
+            models.Index(fields=['status', 'run_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.name} #{self.pk} ({self.status})"
+
+
+class ProductSales(models.Model):
+    """
+    All-time units sold and revenue per product, maintained on order placement.
+
+    Each product's totals are spread over several `shard` rows that readers sum.
+    """
+    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='sales')
+    shard = models.PositiveSmallIntegerField(default=0)
+    quantity = models.PositiveIntegerField(default=0)
+    revenue = models.DecimalField(max_digits=14, decimal_places=2, default=Decimal('0'))
+
+    objects = ShardedRollupManager()
+
+    class Meta:
+        verbose_name = 'Product Sales'
+        verbose_name_plural = 'Product Sales'
+        constraints = [
+            models.UniqueConstraint(fields=['product', 'shard'], name='unique_product_sales_shard'),
+        ]
+
+    def __str__(self):
+        return f"Sales of {self.product.name}"
+
+
+class ProductSalesDaily(models.Model):
+    """
+    Units sold and revenue per product per day, maintained on order placement.
+
+    Each product's day is spread over several `shard` rows that readers sum.
+    """
+    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='daily_sales')
+    day = models.DateField()
+    shard = models.PositiveSmallIntegerField(default=0)
+    quantity = models.PositiveIntegerField(default=0)
+    revenue = models.DecimalField(max_digits=14, decimal_places=2, default=Decimal('0'))
+
+    objects = ShardedRollupManager()
+
+    class Meta:
+        verbose_name = 'Product Daily Sales'
+        verbose_name_plural = 'Product Daily Sales'
+        constraints = [
+            models.UniqueConstraint(fields=['product', 'day', 'shard'], name='unique_product_sales_day'),
+        ]
+        indexes = [
+            models.Index(fields=['day']),
+        ]
+
+    def __str__(self):
+        return f"Sales of {self.product.name} on {self.day}"
+
+
+class SalesBucketManager(ShardedRollupManager):
+    def add_orders(self, entries):
+        """
+        Add `(created_at, status, orders, revenue)` deltas to the hour and day buckets.
+
+        Deltas may be negative, e.g. when an order moves out of a status.
+        """
+        totals = {}
+        for created_at, status, orders, revenue in entries:
+            for span, start in self.model.bucket_starts(created_at).items():
+                key = (span, start, status)
+                count, amount = totals.get(key, (0, Decimal('0')))
+                totals[key] = (count + orders, amount + revenue)
+
+        self.increment(['span', 'start', 'status'], [
+            {'span': span, 'start': start, 'status': status, 'orders': count, 'revenue': amount}
+            for (span, start, status), (count, amount) in totals.items()
+            if count or amount
+        ])
+
+
+class SalesBucket(models.Model):
+    """
+    Order count and revenue per hour and per day, split by order status.
+
+    Maintained when orders are placed and when they change status, and read
+    by the admin sales analytics. Each bucket is spread over several `shard`
+    rows that readers sum. See core_app.rollups.
+    """
+
+    SPAN_CHOICES = [
+        ('hour', 'Hour'),
+        ('day', 'Day'),
+    ]
+
+    span = models.CharField(max_length=4, choices=SPAN_CHOICES)
+    start = models.DateTimeField()
+    status = models.CharField(max_length=20, choices=Order.STATUS_CHOICES)
+    shard = models.PositiveSmallIntegerField(default=0)
+    orders = models.IntegerField(default=0)
+    revenue = models.DecimalField(max_digits=14, decimal_places=2, default=Decimal('0'))
+
+    objects = SalesBucketManager()
+
+    class Meta:
+        verbose_name = 'Sales Bucket'
+        verbose_name_plural = 'Sales Buckets'
+        constraints = [
+            models.UniqueConstraint(fields=['span', 'start', 'status', 'shard'], name='unique_sales_bucket'),
+        ]
+
+    def __str__(self):
+        return f"{self.span} from {self.start:%Y-%m-%d %H:%M} ({self.status})"
+
+    @staticmethod
+    def bucket_starts(moment):
+        """Start of the hour and of the day containing `moment`, in the current time zone."""
+        hour = timezone.localtime(moment).replace(minute=0, second=0, microsecond=0)
+        return {'hour': hour, 'day': hour.replace(hour=0)}
+
+
+class BuyerSketchManager(models.Manager):
+    def add_buyers(self, day, buyers):
+        """
+        Add `{product_id: user_ids}` to the sketches of `day`.
+
+        A `None` product is the store-wide sketch of customers who ordered
+        anything that day. The rows are created if missing, locked in one
+        query, merged in Python and written back with one bulk update.
+        """
+        if not buyers:
+            return
+        with transaction.atomic(using=self.db):
+            empty = HyperLogLog().to_bytes()
+            self.bulk_create(
+                [self.model(product_id=product_id, day=day, registers=empty) for product_id in buyers],
+                ignore_conflicts=True,
+            )
+            product_ids = [product_id for product_id in buyers if product_id is not None]
+            scope = Q(product_id__in=product_ids)
+            if None in buyers:
+                scope |= Q(product__isnull=True)
+            sketches = list(self.select_for_update().filter(scope, day=day).order_by('pk'))
+            for sketch in sketches:
+                merged = HyperLogLog.from_bytes(sketch.registers).update(buyers[sketch.product_id])
+                sketch.registers = merged.to_bytes()
+            self.bulk_update(sketches, ['registers'])
+
+
+class BuyerSketch(models.Model):
+    """
+    HyperLogLog sketch of the distinct customers who bought a product on a day.
+
+    Rows without a product cover the whole store. Sketches of several days
+    merge into the sketch of the range; see core_app.hll for the error bound.
+    """
+    product = models.ForeignKey(Product, on_delete=models.CASCADE, null=True, blank=True, related_name='buyer_sketches')
+    day = models.DateField()
+    registers = models.BinaryField()
+
+    objects = BuyerSketchManager()
+
+    class Meta:
+        verbose_name = 'Buyer Sketch'
+        verbose_name_plural = 'Buyer Sketches'
+        constraints = [
+            models.UniqueConstraint(fields=['product', 'day'], condition=Q(product__isnull=False), name='unique_product_buyer_sketch'),
+            models.UniqueConstraint(fields=['day'], condition=Q(product__isnull=True), name='unique_store_buyer_sketch'),
+        ]
+
+    def __str__(self):
+        return f"Buyers of {self.product.name if self.product_id else 'the store'} on {self.day}"
+
+
+class ProductRecommendation(models.Model):
+    """
+    One of the top products bought together with `product`, best first by `rank`.
+
+    Rebuilt offline by the `build_recommendations` command; see
+    core_app.recommendations.
+    """
+    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='recommendations')
+    recommended = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='recommended_with')
+    rank = models.PositiveSmallIntegerField()
+    # Number of orders containing both products.
+    score = models.PositiveIntegerField()
+
+    class Meta:
+        verbose_name = 'Product Recommendation'
+        verbose_name_plural = 'Product Recommendations'
+        ordering = ['product', 'rank']
+        constraints = [
+            models.UniqueConstraint(fields=['product', 'rank'], name='unique_product_recommendation_rank'),
+        ]
+
+    def __str__(self):
+        return f"{self.recommended.name} with {self.product.name}"
@@ -0,0 +1,157 @@
+import json
+from base64 import b64decode, b64encode
+from functools import reduce
+from operator import or_
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Keyset (cursor) pagination shared by the customer and admin list views.
+
+    The cursor holds the values of every ordering column of the row it points
+    at, and pages are fetched by comparing the whole ordering tuple, e.g.
+    `WHERE price > p OR (price = p AND id > i)` for `('price', 'id')`, so rows
+    that tie on the first column are paged correctly however many there are.
+    No OFFSET or `COUNT(*)` is issued, so every page costs the same no matter
+    how deep the client goes or how large the table is. The cursor is opaque
+    and stays stable while new rows are inserted.
+
+    Views may expose extra orderings through `ordering_fields`, a mapping of the
+    `?ordering=` query value to an ordering tuple. Every ordering must end in
+    a unique column (normally `id`), name only non-null model fields and be
+    backed by an index on the same columns.
+    """
+    page_size = 25
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = ('-created_at', '-id')
+    ordering_fields = {}
+
+    def get_ordering(self, request, queryset, view):
+        requested = request.query_params.get('ordering')
+        if requested in self.ordering_fields:
+            return self.ordering_fields[requested]
+        return self.ordering
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.reverse, position = self.decode_cursor(request)
+
+        ordering = self.ordering
+        if self.reverse:
+            ordering = tuple(field[1:] if field.startswith('-') else f'-{field}' for field in ordering)
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            try:
+                queryset = queryset.filter(self.seek_filter(ordering, position))
+            except (TypeError, ValueError, ValidationError):
+                raise NotFound(self.invalid_cursor_message)
+
+        # One extra row tells whether there is another page in this direction.
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        self.page = results[:self.page_size]
+        if self.reverse:
+            self.page.reverse()
+
+        self.has_next = has_more if not self.reverse else True
+        self.has_previous = has_more if self.reverse else position is not None
+        return self.page
+
+    def seek_filter(self, ordering, position):
+        """Rows strictly after `position` in `ordering`, as `(a > x) OR (a = x AND b > y) ...`."""
+        if len(position) != len(ordering):
+            raise NotFound(self.invalid_cursor_message)
+        columns = [
+            (field.lstrip('-'), 'lt' if field.startswith('-') else 'gt', value)
+            for field, value in zip(ordering, position)
+        ]
+        branches = []
+        for index, (name, lookup, value) in enumerate(columns):
+            equal = {column: previous for column, _, previous in columns[:index]}
+            branches.append(Q(**equal, **{f'{name}__{lookup}': value}))
+        # The redundant bound on the first column lets the database seek the
+        # index instead of filtering the OR branches row by row.
+        name, lookup, value = columns[0]
+        return Q(**{f'{name}__{lookup}e': value}) & reduce(or_, branches)
+
+    def get_position(self, instance):
+        # Serialized by the model fields themselves, keeping full datetime
+        # precision; the lookups parse the strings back.
+        return [instance._meta.get_field(field.lstrip('-')).value_to_string(instance) for field in self.ordering]
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor((False, self.get_position(self.page[-1])))
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor((True, self.get_position(self.page[0])))
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return False, None
+        try:
+            cursor = json.loads(b64decode(encoded.encode('ascii')))
+            reverse, position = bool(cursor['r']), cursor['p']
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(position, list):
+            raise NotFound(self.invalid_cursor_message)
+        return reverse, position
+
+    def encode_cursor(self, cursor):
+        reverse, position = cursor
+        data = json.dumps({'r': int(reverse), 'p': position}, separators=(',', ':'))
+        return replace_query_param(self.base_url, self.cursor_query_param, b64encode(data.encode()).decode('ascii'))
+
+
+class ProductPagination(KeysetPagination):
+    """Keyset pagination for product lists"""
+    page_size = 24
+    ordering_fields = {
+        'newest': ('-created_at', '-id'),
+        'oldest': ('created_at', 'id'),
+        'price': ('price', 'id'),
+        '-price': ('-price', '-id'),
+        'rating': ('-average_rating', '-id'),
+    }
+
+
+class CustomerPagination(KeysetPagination):
+    """Keyset pagination for customers list"""
+    ordering = ('-date_joined', '-id')
+
+
+class OrderPagination(KeysetPagination):
+    """Keyset pagination for orders list"""
+    ordering = ('-created_at', '-id')
+
+
+class SearchPagination(PageNumberPagination):
+    """
+    Page number pagination for ranked search results.
+
+    Search results are ordered by a computed rank, which has no index to seek
+    on, so they are paged with LIMIT/OFFSET instead of a keyset cursor.
+    """
+    page_size = 24
+    page_size_query_param = 'page_size'
+    max_page_size = 100
@@ -0,0 +1,152 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import numpy as np
+from django.db import connections, transaction
+from django.db.models import Max, Min, Sum
+
+from .models import OrderItem, Product, ProductRecommendation
+
+# Orders with more distinct products than this are left out of the build:
+# each adds k*(k-1)/2 pairs and says little about what goes together.
+MAX_BASKET_SIZE = 50
+
+
+def _sum_by_key(keys, counts):
+    """Collapse duplicate pair keys, adding up their counts. Returns sorted keys."""
+    if not len(keys):
+        return keys, counts
+    unique, inverse = np.unique(keys, return_inverse=True)
+    return unique, np.bincount(inverse, weights=counts, minlength=len(unique)).astype(np.int64)
+
+
+def _merge(chunks):
+    """Merge `(keys, counts)` chunks into one."""
+    return _sum_by_key(
+        np.concatenate([keys for keys, _ in chunks]),
+        np.concatenate([counts for _, counts in chunks]),
+    )
+
+
+def count_pairs(order_range, base):
+    """
+    Count how often each pair of products shares an order, for orders with ids in `order_range`.
+
+    Pairs are returned as sorted `product_a * base + product_b` keys (with
+    `product_a < product_b`) and their counts. Runs in a worker process.
+    """
+    first, last = order_range
+    rows = np.array(
+        OrderItem.objects.filter(order_id__gte=first, order_id__lt=last)
+        .order_by('order_id', 'product_id')
+        .values_list('order_id', 'product_id'),
+        dtype=np.int64,
+    ).reshape(-1, 2)
+    orders, products = rows[:, 0], rows[:, 1]
+
+    _, sizes = np.unique(orders, return_counts=True)
+    kept = np.repeat(sizes <= MAX_BASKET_SIZE, sizes)
+    orders, products = orders[kept], products[kept]
+
+    # Within each order the products are sorted, so comparing every item with
+    # the one `offset` places further on yields each pair exactly once.
+    keys = []
+    for offset in range(1, MAX_BASKET_SIZE):
+        same_order = orders[offset:] == orders[:-offset]
+        if not same_order.any():
+            break
+        first_products, second_products = products[:-offset][same_order], products[offset:][same_order]
+        distinct = first_products != second_products
+        keys.append(first_products[distinct] * base + second_products[distinct])
+
+    keys = np.concatenate(keys) if keys else np.empty(0, dtype=np.int64)
+    return _sum_by_key(keys, np.ones(len(keys), dtype=np.int64))
+
+
+def top_neighbours(keys, counts, base, top_k, min_score=1):
+    """
+    Pick the `top_k` products most often bought with each product.
+
+    Returns `(product, recommended, rank, score)` arrays ordered by product
+    and rank. Ties are broken by the lower product id.
+    """
+    kept = counts >= min_score
+    first, second = np.divmod(keys[kept], base)
+    product = np.concatenate([first, second])
+    recommended = np.concatenate([second, first])
+    score = np.concatenate([counts[kept], counts[kept]])
+
+    order = np.lexsort((recommended, -score, product))
+    product, recommended, score = product[order], recommended[order], score[order]
+    rank = np.arange(len(product)) - np.searchsorted(product, product, side='left')
+    top = rank < top_k
+    return product[top], recommended[top], rank[top], score[top]
+
+
+def build_recommendations(top_k=10, min_score=1, workers=None, chunk_orders=50000, batch_size=5000):
+    """
+    Rebuild `ProductRecommendation` from the order history.
+
+    Orders are split into id ranges of `chunk_orders`, and a pool of
+    `workers` processes counts the product pairs of each range, so no
+    process holds more than one range of order items. The parent merges the
+    sparse per-range counts (sorted pair keys and counts), keeps the
+    `top_k` neighbours of every product seen together at least `min_score`
+    times and replaces the table in one transaction.
+
+    Workers are forked from this process, so the database connections are
+    closed first and each worker opens its own.
+
+    Returns the number of recommendation rows written.
+    """
+    bounds = OrderItem.objects.aggregate(first=Min('order_id'), last=Max('order_id'), base=Max('product_id'))
+    if bounds['first'] is None:
+        columns = [np.empty(0, dtype=np.int64)] * 4
+    else:
+        base = bounds['base'] + 1
+        ranges = [
+            (start, min(start + chunk_orders, bounds['last'] + 1))
+            for start in range(bounds['first'], bounds['last'] + 1, chunk_orders)
+        ]
+        keys, counts = np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        pending = []
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('fork')) as pool:
+            for chunk in pool.map(count_pairs, ranges, repeat(base)):
+                pending.append(chunk)
+                # Merge once the pending counts outgrow the merged ones, so each
+                # pair is re-sorted a logarithmic number of times.
+                if sum(len(chunk_keys) for chunk_keys, _ in pending) >= len(keys):
+                    keys, counts = _merge([(keys, counts), *pending])
+                    pending = []
+        keys, counts = _merge([(keys, counts), *pending])
+        columns = top_neighbours(keys, counts, base, top_k, min_score)
+
+    with transaction.atomic():
+        ProductRecommendation.objects.all().delete()
+        for start in range(0, len(columns[0]), batch_size):
+            ProductRecommendation.objects.bulk_create([
+                ProductRecommendation(product_id=product, recommended_id=recommended, rank=rank, score=score)
+                for product, recommended, rank, score
+                in zip(*(column[start:start + batch_size].tolist() for column in columns))
+            ])
+    return len(columns[0])
+
+
+def recommended_products(product_ids, limit=10):
+    """
+    Active products most often bought with any of `product_ids`, best first.
+
+    `product_ids` may be a list or a `values('product_id')` queryset, which
+    is inlined as a subquery. Scores of products recommended for several of
+    them are added up and the given products themselves are left out.
+    Runs as one query over the `(product, rank)` index.
+    """
+    return (
+        Product.objects.active()
+        .filter(recommended_with__product__in=product_ids)
+        .exclude(pk__in=product_ids)
+        .annotate(score=Sum('recommended_with__score'))
+        .order_by('-score', 'pk')[:limit]
+    )
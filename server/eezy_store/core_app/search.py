@@ -0,0 +1,143 @@
+import re
+import threading
+from collections import defaultdict
+
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connections
+from django.db.models import Case, F, FloatField, IntegerField, Value, When
+
+SEARCH_CONFIG = 'english'
+
+# Mirrors the PostgreSQL trigger, which weights name as 'A' and description as 'B'.
+# 1.0 and 0.4 are PostgreSQL's default weights for those labels.
+FIELD_WEIGHTS = {'name': 1.0, 'description': 0.4}
+
+TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+# Keeps the fallback's CASE expressions within SQLite's parameter limits.
+MAX_FALLBACK_RESULTS = 500
+
+
+def tokenize(text):
+    return TOKEN_RE.findall((text or '').lower())
+
+
+class InvertedIndex:
+    """
+    In-process inverted index over product names and descriptions.
+
+    Used as the search backend when the database is not PostgreSQL (the SQLite
+    test database), so search can be exercised and benchmarked locally. The
+    index is built lazily from the database on the first search and then kept
+    current by the Product save/delete signals in `core_app.signals`. It only
+    holds active products: soft-deleted ones are dropped as they are saved,
+    so they never take up places in the capped result list.
+
+    Every query term must match (as with `websearch_to_tsquery`). Results are
+    ranked by the weighted term frequency of the matched terms.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._postings = defaultdict(dict)
+        self._documents = {}
+        self._built = False
+
+    def build(self, products):
+        postings = defaultdict(dict)
+        documents = {}
+        for product_id, name, description in products:
+            terms = self._score_terms(name, description)
+            documents[product_id] = terms
+            for term, score in terms.items():
+                postings[term][product_id] = score
+        with self._lock:
+            self._postings = postings
+            self._documents = documents
+            self._built = True
+
+    def ensure_built(self, using='default'):
+        if not self._built:
+            from .models import Product
+            self.build(Product.objects.using(using).active().values_list('id', 'name', 'description').iterator())
+
+    def update(self, product_id, name, description):
+        if not self._built:
+            return
+        with self._lock:
+            self._discard(product_id)
+            terms = self._score_terms(name, description)
+            self._documents[product_id] = terms
+            for term, score in terms.items():
+                self._postings[term][product_id] = score
+
+    def remove(self, product_id):
+        if not self._built:
+            return
+        with self._lock:
+            self._discard(product_id)
+
+    def clear(self):
+        with self._lock:
+            self._postings = defaultdict(dict)
+            self._documents = {}
+            self._built = False
+
+    def search(self, query):
+        """Return `(product_id, rank)` pairs, best match first."""
+        terms = set(tokenize(query))
+        if not terms:
+            return []
+        with self._lock:
+            matches = [self._postings.get(term, {}) for term in terms]
+            if not all(matches):
+                return []
+            matches.sort(key=len)
+            candidates = set(matches[0]).intersection(*matches[1:])
+            ranked = [(pid, sum(posting[pid] for posting in matches)) for pid in candidates]
+        ranked.sort(key=lambda item: (-item[1], -item[0]))
+        return ranked
+
+    def _discard(self, product_id):
+        for term in self._documents.pop(product_id, {}):
+            posting = self._postings.get(term)
+            if posting is not None:
+                posting.pop(product_id, None)
+                if not posting:
+                    del self._postings[term]
+
+    @staticmethod
+    def _score_terms(name, description):
+        terms = defaultdict(float)
+        for field, text in (('name', name), ('description', description)):
+            for term in tokenize(text):
+                terms[term] += FIELD_WEIGHTS[field]
+        return dict(terms)
+
+
+product_index = InvertedIndex()
+
+
+def search_products(queryset, query):
+    """
+    Filter `queryset` down to products matching `query`, annotated with `rank`
+    and ordered best match first.
+
+    On PostgreSQL this is a `websearch_to_tsquery` match against the GIN
+    indexed `search_vector` column. Any other backend uses `product_index`.
+    """
+    if connections[queryset.db].vendor == 'postgresql':
+        search_query = SearchQuery(query, search_type='websearch', config=SEARCH_CONFIG)
+        return queryset.filter(search_vector=search_query).annotate(
+            rank=SearchRank(F('search_vector'), search_query)
+        ).order_by('-rank', '-id')
+
+    product_index.ensure_built(using=queryset.db)
+    ranked = product_index.search(query)[:MAX_FALLBACK_RESULTS]
+    if not ranked:
+        return queryset.none()
+    return queryset.filter(pk__in=[pid for pid, _ in ranked]).annotate(
+        rank=Case(*[When(pk=pid, then=Value(score)) for pid, score in ranked], output_field=FloatField()),
+        position=Case(*[When(pk=pid, then=Value(i)) for i, (pid, _) in enumerate(ranked)],
+                      output_field=IntegerField()),
+    ).order_by('position')
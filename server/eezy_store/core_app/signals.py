@@ -0,0 +1,32 @@
+from functools import partial
+
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .authentication import user_cache
+from .models import Product
+from .search import product_index
+
+
+@receiver(post_save, sender=Product)
+def index_product(sender, instance, **kwargs):
+    if instance.is_deleted:
+        product_index.remove(instance.pk)
+    else:
+        product_index.update(instance.pk, instance.name, instance.description)
+
+
+@receiver(post_delete, sender=Product)
+def unindex_product(sender, instance, **kwargs):
+    product_index.remove(instance.pk)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_cached_user(sender, instance, **kwargs):
+    # Covers password changes and any other edit, wherever it is made. After
+    # commit, so a concurrent miss either reads the new row or stores the old
+    # one under the generation this replaces.
+    transaction.on_commit(partial(user_cache.invalidate, instance.pk))
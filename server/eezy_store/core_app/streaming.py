@@ -0,0 +1,91 @@
+import csv
+import json
+import zlib
+
+from django.core.serializers.json import DjangoJSONEncoder
+from rest_framework.utils.encoders import JSONEncoder
+
+# Strings smaller than this are joined before being handed to the server,
+# so a stream of short rows does not turn into one socket write per row.
+STREAM_BUFFER_SIZE = 64 * 1024
+
+
+def stream_json_list(key, rows):
+    """
+    Yield `{"<key>": [row, row, ...]}` as JSON text, one row at a time.
+
+    `rows` may be any iterable of JSON-serializable values (typically the
+    serialized rows of a `queryset.iterator(chunk_size=...)`), so the full
+    document never has to exist in memory.
+    """
+    yield f'{{{json.dumps(key)}: ['
+    separator = ''
+    for row in rows:
+        yield separator + json.dumps(row, cls=JSONEncoder)
+        separator = ', '
+    yield ']}'
+
+
+def serialize_iterator(queryset, serializer_class, chunk_size=500, context=None):
+    """Serialize `queryset` row by row over a server-side cursor."""
+    for instance in queryset.iterator(chunk_size=chunk_size):
+        yield serializer_class(instance, context=context).data
+
+
+class _Echo:
+    """File-like object whose `write` returns the value, for `csv.writer`."""
+
+    def write(self, value):
+        return value
+
+
+def stream_csv(header, rows):
+    """Yield `header` and each row of `rows` as CSV lines."""
+    writer = csv.writer(_Echo())
+    yield writer.writerow(header)
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def stream_jsonl(rows):
+    """Yield each row as one line of JSON (dates as ISO 8601, decimals as strings)."""
+    for row in rows:
+        yield json.dumps(row, cls=DjangoJSONEncoder) + '\n'
+
+
+def buffered(chunks, size=STREAM_BUFFER_SIZE):
+    """
+    Join small string chunks into pieces of roughly `size` characters.
+
+    The first chunk is passed through immediately so the client gets its
+    first byte without waiting for a full buffer.
+    """
+    buffer, length = [], 0
+    for index, chunk in enumerate(chunks):
+        if index == 0:
+            yield chunk
+            continue
+        buffer.append(chunk)
+        length += len(chunk)
+        if length >= size:
+            yield ''.join(buffer)
+            buffer, length = [], 0
+    if buffer:
+        yield ''.join(buffer)
+
+
+def gzip_stream(chunks, level=6):
+    """
+    Compress string chunks into a gzip stream incrementally, in constant memory.
+
+    The first chunk is flushed straight away so compressed responses also
+    start immediately.
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for index, chunk in enumerate(chunks):
+        data = compressor.compress(chunk.encode())
+        if index == 0:
+            data += compressor.flush(zlib.Z_SYNC_FLUSH)
+        if data:
+            yield data
+    yield compressor.flush()
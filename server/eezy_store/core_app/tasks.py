@@ -0,0 +1,25 @@
+from django.conf import settings
+
+from .jobs import enqueue, register_job
+from .models import Order
+from .rollups import record_order_buyers
+from .tokens import sweep_expired_tokens
+
+
+@register_job('record_order_buyers')
+def record_order_buyers_job(order_id):
+    """
+    Add a newly placed order's customer to the unique buyer sketches.
+    """
+    record_order_buyers(Order.objects.get(pk=order_id))
+
+
+@register_job('sweep_expired_tokens')
+def sweep_expired_tokens_job():
+    """
+    Delete expired JWT tokens, then queue the next sweep.
+
+    Started once with `manage.py sweep_expired_tokens --schedule`.
+    """
+    sweep_expired_tokens()
+    enqueue('sweep_expired_tokens', delay=settings.TOKEN_BLACKLIST['SWEEP_INTERVAL'])
@@ -0,0 +1,180 @@
+import hashlib
+import math
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.throttling import SimpleRateThrottle
+
+from .cache import increment_counter
+
+
+class SlidingWindowThrottle(SimpleRateThrottle):
+    """
+    Sliding window rate limit kept as two atomic counters in a shared cache.
+
+    Requests are counted per fixed window of the rate's period; the current
+    count plus the previous window's count, weighted by how much of it still
+    overlaps the sliding window, is compared with the limit. That costs an
+    `add`/`incr` and a `get` per request, with no read-modify-write race,
+    unlike DRF's history-list throttles. A rejected request takes its count
+    back, so requests made while blocked do not extend the block.
+
+    The rate comes from `DEFAULT_THROTTLE_RATES['<view.throttle_scope>_<kind>']`;
+    views without a rate for the scope are not limited. Shed requests are
+    counted per scope for `throttle_stats`. The counters live in the
+    `AUTH_THROTTLE['ALIAS']` cache, which must be shared (Redis, Memcached)
+    for the limits to hold across workers.
+    """
+
+    kind = None
+    # Whether allow_request counts the request; throttles that only count some
+    # outcomes leave it off and call `record` themselves.
+    count_requests = True
+    SHED_KEY = 'throttle:stats:shed:{scope}'
+
+    def __init__(self):
+        # The rate depends on the view's scope, so it is looked up in allow_request.
+        pass
+
+    @property
+    def cache(self):
+        return caches[settings.AUTH_THROTTLE['ALIAS']]
+
+    def get_ident_value(self, request, view):
+        raise NotImplementedError('.get_ident_value() must be overridden')
+
+    def get_cache_key(self, request, view):
+        value = self.get_ident_value(request, view)
+        if not value:
+            return None
+        ident = hashlib.sha256(value.encode()).hexdigest()[:32]
+        return self.cache_format % {'scope': self.scope, 'ident': ident}
+
+    def prepare(self, request, view):
+        """Set up the scope and rate for `view`; returns the counter key, or None if not limited."""
+        scope = getattr(view, 'throttle_scope', None)
+        if not scope:
+            return None
+        self.scope = f'{scope}_{self.kind}'
+        self.rate = self.THROTTLE_RATES.get(self.scope)
+        if self.rate is None:
+            return None
+        self.num_requests, self.duration = self.parse_rate(self.rate)
+        return self.get_cache_key(request, view)
+
+    def allow_request(self, request, view):
+        key = self.prepare(request, view)
+        if key is None:
+            return True
+
+        now = self.timer()
+        window = int(now // self.duration)
+        elapsed = (now % self.duration) / self.duration
+        if self.count_requests:
+            current = self._hit(f'{key}:{window}')
+        else:
+            # As if this request were counted.
+            current = self.cache.get(f'{key}:{window}', 0) + 1
+        previous = self.cache.get(f'{key}:{window - 1}', 0)
+
+        weighted = previous * (1 - elapsed) + current
+        if weighted <= self.num_requests:
+            return True
+
+        if self.count_requests:
+            self._unhit(f'{key}:{window}')
+        # Time until the previous window's share has decayed enough, or the
+        # current window has ended.
+        if previous and current <= self.num_requests:
+            self.retry_after = self.duration * ((weighted - self.num_requests) / previous)
+        else:
+            self.retry_after = self.duration * (1 - elapsed)
+        increment_counter(self.cache, self.SHED_KEY.format(scope=self.scope))
+        return False
+
+    def record(self, request, view):
+        """Count a request against the limit after the fact."""
+        key = self.prepare(request, view)
+        if key is not None:
+            self._hit(f'{key}:{int(self.timer() // self.duration)}')
+
+    def _hit(self, key):
+        # Two windows' worth, so the previous window is still readable.
+        if self.cache.add(key, 1, timeout=2 * self.duration):
+            return 1
+        try:
+            return self.cache.incr(key)
+        except ValueError:
+            # Expired between add and incr.
+            self.cache.add(key, 1, timeout=2 * self.duration)
+            return 1
+
+    def _unhit(self, key):
+        try:
+            self.cache.decr(key)
+        except ValueError:
+            # Expired since the hit; nothing to take back.
+            pass
+
+    def wait(self):
+        return math.ceil(self.retry_after)
+
+
+class IPThrottle(SlidingWindowThrottle):
+    """Limits requests per client address (`<scope>_ip` rate)."""
+
+    kind = 'ip'
+
+    def get_ident_value(self, request, view):
+        return self.get_ident(request)
+
+
+class AccountThrottle(SlidingWindowThrottle):
+    """
+    Limits failed attempts per targeted account (`<scope>_account` rate).
+
+    The account is the request body field named by `view.throttle_account_field`,
+    normalized to lower case, so attempts against one account are limited
+    whatever addresses they come from. Nothing is looked up in the database.
+
+    Only attempts the view answers with a client error (bad credentials,
+    inactive account, duplicate signup) are counted, through
+    `AccountThrottleMixin`; successful logins and rejected requests are not,
+    so nobody can keep the owner locked out by hammering the endpoint after
+    the limit is reached. Concurrent attempts are checked before any of them
+    is counted, so a burst may overshoot the limit by its size.
+    """
+
+    kind = 'account'
+    count_requests = False
+
+    def get_ident_value(self, request, view):
+        field = getattr(view, 'throttle_account_field', None)
+        value = request.data.get(field) if field and hasattr(request.data, 'get') else None
+        return value.strip().lower() if isinstance(value, str) else None
+
+
+class AccountThrottleMixin:
+    """Counts the failed attempts of a view against its `AccountThrottle`."""
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if 400 <= response.status_code < 500 and response.status_code != 429:
+            for throttle in self.get_throttles():
+                if isinstance(throttle, AccountThrottle):
+                    throttle.record(request, self)
+        return response
+
+
+def throttle_stats():
+    """Requests shed per throttle scope since the counters were last cleared."""
+    cache = caches[settings.AUTH_THROTTLE['ALIAS']]
+    scopes = sorted(SimpleRateThrottle.THROTTLE_RATES)
+    shed = cache.get_many([SlidingWindowThrottle.SHED_KEY.format(scope=scope) for scope in scopes])
+    return {
+        scope: {
+            'rate': SimpleRateThrottle.THROTTLE_RATES[scope],
+            'shed': shed.get(SlidingWindowThrottle.SHED_KEY.format(scope=scope), 0),
+        }
+        for scope in scopes
+    }
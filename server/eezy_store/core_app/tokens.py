@@ -0,0 +1,126 @@
+import logging
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from .bloom import BloomFilter
+
+logger = logging.getLogger(__name__)
+
+
+class BlacklistFilter:
+    """
+    Per-process Bloom filter of the JTIs of unexpired blacklisted tokens.
+
+    A JTI that is not in the filter is certainly not blacklisted, so the
+    common case skips the `BlacklistedToken` query; a hit is confirmed
+    against the database. The filter picks up tokens blacklisted by other
+    processes with a cheap query for rows added since the last sync, at most
+    every `FILTER_SYNC_INTERVAL` seconds; during that window another worker
+    may still accept a token that was just blacklisted. Set the interval to
+    0 to sync on every check. Tokens blacklisted through `FilteredRefreshToken`
+    in this process are added at once. The whole filter is rebuilt every
+    `FILTER_REBUILD_INTERVAL` seconds, dropping expired tokens, resizing it
+    and catching rows committed out of id order.
+    """
+
+    def __init__(self):
+        self.config = settings.TOKEN_BLACKLIST
+        self.lock = threading.Lock()
+        self.filter = None
+        self.built_at = self.synced_at = 0.0
+        self.high_water = self.previous_high_water = 0
+
+    def rebuild(self):
+        blacklisted = BlacklistedToken.objects.filter(token__expires_at__gt=timezone.now())
+        high_water = BlacklistedToken.objects.aggregate(last=Max('pk'))['last'] or 0
+        jtis = list(blacklisted.filter(pk__lte=high_water).values_list('token__jti', flat=True))
+        bloom = BloomFilter(max(len(jtis) * 2, self.config['FILTER_MIN_CAPACITY']), self.config['FILTER_ERROR_RATE'])
+        bloom.update(jtis)
+
+        self.filter = bloom
+        self.high_water = self.previous_high_water = high_water
+        self.built_at = self.synced_at = time.monotonic()
+        logger.info(f"Rebuilt token blacklist filter with {len(jtis)} token(s)")
+
+    def sync(self):
+        """Add tokens blacklisted since the last sync, re-reading the previous sync's rows too."""
+        rows = list(
+            BlacklistedToken.objects.filter(pk__gt=self.previous_high_water)
+            .values_list('pk', 'token__jti')
+        )
+        self.filter.update(jti for _, jti in rows)
+        self.previous_high_water = self.high_water
+        self.high_water = max([self.high_water, *(pk for pk, _ in rows)])
+        self.synced_at = time.monotonic()
+
+    def refresh(self):
+        now = time.monotonic()
+        if self.filter is not None and now - self.synced_at < self.config['FILTER_SYNC_INTERVAL']:
+            return
+        with self.lock:
+            if self.filter is None or now - self.built_at >= self.config['FILTER_REBUILD_INTERVAL']:
+                self.rebuild()
+            elif now - self.synced_at >= self.config['FILTER_SYNC_INTERVAL']:
+                self.sync()
+
+    def add(self, jti):
+        if self.filter is not None:
+            with self.lock:
+                self.filter.add(jti)
+
+    def might_contain(self, jti):
+        self.refresh()
+        return jti in self.filter
+
+
+blacklist_filter = BlacklistFilter()
+
+
+class FilteredRefreshToken(RefreshToken):
+    """`RefreshToken` that checks `blacklist_filter` before querying the blacklist."""
+
+    def check_blacklist(self):
+        if blacklist_filter.might_contain(self.payload[api_settings.JTI_CLAIM]):
+            super().check_blacklist()
+
+    def blacklist(self):
+        blacklisted = super().blacklist()
+        blacklist_filter.add(self.payload[api_settings.JTI_CLAIM])
+        return blacklisted
+
+
+def sweep_expired_tokens(chunk_size=None, grace=timedelta(0)):
+    """
+    Delete outstanding tokens (and their blacklist entries) that expired over `grace` ago.
+
+    Deletes `chunk_size` tokens per transaction, so each one only locks a
+    small batch of rows and logins and logouts never wait long. Expired
+    tokens fail validation on their own, so removing them changes nothing
+    for clients. Returns the number of outstanding tokens deleted.
+    """
+    chunk_size = chunk_size or settings.TOKEN_BLACKLIST['SWEEP_CHUNK_SIZE']
+    cutoff = timezone.now() - grace
+    deleted = 0
+    while True:
+        with transaction.atomic():
+            ids = list(
+                # Oldest ids first: they expire first, and the primary key
+                # index finds them without scanning the whole table.
+                OutstandingToken.objects.filter(expires_at__lt=cutoff)
+                .order_by('pk')
+                .values_list('pk', flat=True)[:chunk_size]
+            )
+            if not ids:
+                return deleted
+            # Cascades to the tokens' blacklist entries.
+            OutstandingToken.objects.filter(pk__in=ids).delete()
+        deleted += len(ids)
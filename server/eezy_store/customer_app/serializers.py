@@ -2,7 +2,9 @@ from django.contrib.auth.models import User, Group
 from rest_framework import serializers
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
 from core_app.models import Product, Rating, Order, OrderItem, Cart, CartItem, Address
+from core_app.tokens import FilteredRefreshToken
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -72,6 +74,13 @@ class LoginSerializer(serializers.Serializer):
             raise serializers.ValidationError({"error": "not-exist", "message": "Please check your email and try again."})
 
 
+class SecureTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Refresh serializer that checks the blacklist through the in-memory filter.
+    """
+    token_class = FilteredRefreshToken
+
+
 class ProductSerializer(serializers.ModelSerializer):
     average_rating = serializers.FloatField(read_only=True)
     rating_count = serializers.IntegerField(read_only=True)
@@ -82,6 +91,13 @@ class ProductSerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'description', 'price', 'image', 'average_rating', 'rating_count']
 
 
+class ProductSearchSerializer(ProductSerializer):
+    rank = serializers.FloatField(read_only=True)
+
+    class Meta(ProductSerializer.Meta):
+        fields = ProductSerializer.Meta.fields + ['rank']
+
+
 class CartItemSerializer(serializers.ModelSerializer):
     product = ProductSerializer()
     
@@ -96,6 +112,20 @@ class CartSerializer(serializers.ModelSerializer):
         model = Cart
         fields = ['id', 'user', 'items', 'created_at', 'updated_at']
         
+class CheckoutItemSerializer(CartItemSerializer):
+    line_total = serializers.DecimalField(max_digits=12, decimal_places=2, read_only=True)
+
+    class Meta(CartItemSerializer.Meta):
+        fields = CartItemSerializer.Meta.fields + ['line_total']
+
+
+class CheckoutSummarySerializer(serializers.Serializer):
+    """Serializer for `core_app.checkout.get_checkout_summary` results."""
+    cart_items = CheckoutItemSerializer(source='items', many=True)
+    item_count = serializers.IntegerField()
+    total_price = serializers.DecimalField(source='total', max_digits=12, decimal_places=2, coerce_to_string=False)
+
+
 class UpdateCartItemSerializer(serializers.ModelSerializer):
     class Meta:
         model = CartItem
@@ -105,6 +135,28 @@ class RemoveCartItemSerializer(serializers.Serializer):
     id = serializers.IntegerField()
 
 
+class CartOperationSerializer(serializers.Serializer):
+    op = serializers.ChoiceField(choices=['add', 'set', 'remove'])
+    product_id = serializers.IntegerField()
+    quantity = serializers.IntegerField(required=False, min_value=1, max_value=CartItem.MAX_QUANTITY)
+
+    def validate(self, attrs):
+        if attrs['op'] != 'remove' and 'quantity' not in attrs:
+            raise serializers.ValidationError({'quantity': f"Quantity is required for '{attrs['op']}'."})
+        return attrs
+
+
+class CartBatchSerializer(serializers.Serializer):
+    MAX_OPERATIONS = 50
+
+    operations = CartOperationSerializer(many=True, allow_empty=False)
+
+    def validate_operations(self, value):
+        if len(value) > self.MAX_OPERATIONS:
+            raise serializers.ValidationError(f"At most {self.MAX_OPERATIONS} operations per batch.")
+        return value
+
+
 class AddressSerializer(serializers.ModelSerializer):
     class Meta:
         model = Address
@@ -135,6 +187,11 @@ class OrderItemSerializer(serializers.ModelSerializer):
         fields = ['id', 'product_name', 'product_price', 'quantity', 'rating', 'product']
     
     def get_rating(self, obj):
+        # Listing views pass the user's ratings for the whole page as `ratings`
+        # ({product_id: score}) so this never queries per item.
+        ratings = self.context.get('ratings')
+        if ratings is not None:
+            return ratings.get(obj.product_id)
         user = self.context.get('user')
         if user:
             rating = Rating.objects.filter(product=obj.product, user=user).first()
@@ -144,12 +201,8 @@ class OrderItemSerializer(serializers.ModelSerializer):
 class OrderSerializer(serializers.ModelSerializer):
     address = serializers.StringRelatedField()  
     items = OrderItemSerializer(many=True)
-    total_amount = serializers.SerializerMethodField()
 
     class Meta:
         model = Order
-        fields = ['id', 'status', 'total_amount', 'created_at', 'updated_at', 'address', 'items']
-
-    def get_total_amount(self, obj):
-        return str(obj.calculate_total())
+        fields = ['id', 'status', 'total_amount', 'items_count', 'created_at', 'updated_at', 'address', 'items']
 
@@ -1,23 +1,67 @@
 from django.shortcuts import render
 from django.http import JsonResponse
 from django.core.mail import send_mail
+from core_app.jobs import enqueue, register_job
+from core_app.models import Order
 from .otp import generate_otp, verify_otp
 
-def send_otp_email(email):
+
+@register_job('send_email')
+def send_email_job(subject, message, recipient_list):
+    """
+    Send an email from the background worker.
+    """
+    send_mail(subject, message, None, recipient_list, fail_silently=False)
+
+
+@register_job('order_confirmation_email')
+def send_order_confirmation_job(order_id):
+    """
+    Email the customer a summary of a newly placed order.
+    """
+    order = Order.objects.select_related('user').get(pk=order_id)
+    if not order.user.email:
+        return
+
+    lines = [
+        f"{item.quantity} x {item.product.name} @ {item.price}"
+        for item in order.items.select_related('product')
+    ]
+    send_mail(
+        f'Your order #{order.id} has been placed',
+        "Thank you for your order.\n\n" + "\n".join(lines) + f"\n\nTotal: {order.total_amount}",
+        None,
+        [order.user.email],
+        fail_silently=False,
+    )
+
+
+@register_job('otp_email')
+def send_otp_email_job(email):
     """
-    Generate and send OTP to the user's email address.
+    Generate an OTP for the email address and send it.
+
+    The code is only ever held in the OTP cache and the email, never in the
+    job payload, where it would show in the job admin. Verification reads
+    the same cache from the web processes, so it must be shared (REDIS_URL).
+    A retry sends a new code, replacing the old one.
     """
-    
-    # Generate OTP and send via email
     otp = generate_otp(email)
-    
     send_mail(
         'Your OTP Code',
         f'Your OTP code is {otp}. It is valid for 10 minutes.',
+        None,
+        [email],
         fail_silently=False,
-        recipient_list=[email],
     )
 
+
+def send_otp_email(email):
+    """
+    Queue an OTP email for the user's email address.
+    """
+    enqueue('otp_email', {'email': email}, max_attempts=3)
+
     return True
 
 def verify_email_otp(request):
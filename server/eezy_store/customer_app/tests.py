@@ -1,3 +1,59 @@
+from django.contrib.auth.models import User
 from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from core_app.models import Address, Order, OrderItem, Product, Rating
+
+
+class OrderListQueryCountTests(TestCase):
+    """The customer order history must not issue queries per order or per item."""
+
+    # Two validator aggregates, the order page, the prefetched items with
+    # their products, and the user's ratings for the page.
+    EXPECTED_QUERIES = 5
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='buyer', password='pass')
+        cls.address = Address.objects.create(
+            user=cls.user, phone='1', street='s', city='c',
+            state='s', country='c', postal_code='1',
+        )
+        cls.products = [
+            Product.objects.create(name=f'Product {i}', description='d', price=10 + i)
+            for i in range(6)
+        ]
+        Rating.objects.create(product=cls.products[0], user=cls.user, score=4)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def place_orders(self, count):
+        for _ in range(count):
+            order = Order.objects.create(user=self.user, address=self.address, status='delivered')
+            OrderItem.objects.bulk_create([
+                OrderItem(order=order, product=product, quantity=1, price=product.price)
+                for product in self.products
+            ])
+
+    def fetch(self):
+        with self.assertNumQueries(self.EXPECTED_QUERIES):
+            response = self.client.get(reverse('order-list'))
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_query_count_is_constant(self):
+        self.place_orders(2)
+        self.assertEqual(len(self.fetch()['results']), 2)
+
+        self.place_orders(10)
+        self.assertEqual(len(self.fetch()['results']), 12)
+
+    def test_ratings_are_resolved_from_the_batch(self):
+        self.place_orders(1)
+        items = self.fetch()['results'][0]['items']
+        ratings = {item['product']['id']: item['rating'] for item in items}
+        self.assertEqual(ratings[self.products[0].id], 4)
+        self.assertIsNone(ratings[self.products[1].id])
@@ -1,9 +1,12 @@
 from django.urls import path
 from .views import (SignupView, LoginView,
                     LogoutView, SecureTokenRefreshView,
-                    ListAllProductsView, ListAllCartsView,
+                    ListAllProductsView, ProductSearchView,
+                    ProductRecommendationsView, CartRecommendationsView,
+                    ListAllCartsView,
                     AddToCartView, UpdateCartItemView,
-                    RemoveCartItemView, AddressListCreateView,
+                    RemoveCartItemView, CartBatchView,
+                    AddressListCreateView,
                     AddressSelectView, CheckoutView,
                     PlaceOrderView, OrderListView,
                     RatingSubmitView,
@@ -16,11 +19,15 @@ urlpatterns = [
     path('token/refresh', SecureTokenRefreshView.as_view(), name='token_refresh'),
 
     path('products/', ListAllProductsView.as_view(), name='list-products'),
+    path('products/search', ProductSearchView.as_view(), name='search-products'),
+    path('products/<int:pk>/recommendations/', ProductRecommendationsView.as_view(), name='product-recommendations'),
 
     path('carts/', ListAllCartsView.as_view(), name='list-all-carts'),
     path('cart/add/', AddToCartView.as_view(), name='cart-add'),
     path('cart/item/<int:pk>/update/', UpdateCartItemView.as_view(), name='update-cart-item'),
     path('cart/item/<int:pk>/remove/', RemoveCartItemView.as_view(), name='remove-cart-item'),
+    path('cart/batch/', CartBatchView.as_view(), name='cart-batch'),
+    path('cart/recommendations/', CartRecommendationsView.as_view(), name='cart-recommendations'),
 
     path('cart/checkout/', CheckoutView.as_view(), name='checkout'),
     path('cart/checkout/place-order/', PlaceOrderView.as_view(), name='place-order'),
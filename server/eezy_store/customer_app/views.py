@@ -1,6 +1,6 @@
 import logging
 from django.db import transaction
-from django.db.models import F
+from django.db.models import F, Max, Count, Prefetch
 from django.contrib.auth.models import User, Group
 from django.contrib.auth import login, logout
 from rest_framework import generics, permissions, status
@@ -9,23 +9,53 @@ from rest_framework.views import APIView
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
 from rest_framework_simplejwt.views import TokenRefreshView
-from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
 from rest_framework.exceptions import ValidationError
+from django.core.exceptions import ValidationError as DjangoValidationError
 
 from core_app.models import Product, Rating, Address, Order, OrderItem, Cart, CartItem
+from core_app.pagination import ProductPagination, SearchPagination, OrderPagination
+from core_app.search import search_products
+from core_app.cache import CatalogCacheMixin
+from core_app.conditional import conditional_get
+from core_app.idempotency import idempotent
+from core_app.checkout import get_checkout_summary
+from core_app.inventory import InsufficientStock, reserve
+from core_app.jobs import enqueue
+from core_app.rollups import record_order_sales
+from core_app.recommendations import recommended_products
+from core_app.tokens import FilteredRefreshToken
+from core_app.throttling import AccountThrottle, AccountThrottleMixin, IPThrottle
 
 from .serializers import (
-    UserSerializer, LoginSerializer, ProductSerializer,
+    UserSerializer, LoginSerializer, SecureTokenRefreshSerializer,
+    ProductSerializer,
+    ProductSearchSerializer,
     CartItemSerializer, CartSerializer,
     UpdateCartItemSerializer, RemoveCartItemSerializer,
+    CartBatchSerializer,
     AddressSerializer, CheckoutCartSerializer,
+    CheckoutSummarySerializer,
     OrderSerializer)
 
 # Create your views here.
 
 logger = logging.getLogger(__name__)
 
-class SignupView(generics.CreateAPIView):
+
+class CartValidatorMixin:
+    """Conditional GET validators for views rendering the user's cart."""
+
+    def get_validator_state(self, request):
+        state = CartItem.objects.filter(cart__user=request.user).aggregate(
+            items_modified=Max('updated_at'),
+            products_modified=Max('product__updated_at'),
+            count=Count('id'),
+        )
+        return (state['items_modified'], state['products_modified'], state['count'])
+
+
+class SignupView(AccountThrottleMixin, generics.CreateAPIView):
     """
     Create a new user account.
     
@@ -45,10 +75,14 @@ class SignupView(generics.CreateAPIView):
     Responses:
     - 201: User created successfully, awaiting admin approval
     - 400: Bad request with error message
+    - 429: Too many signups from this address or for this email
     """
     
     queryset = User.objects.all()
     permission_classes = [permissions.AllowAny]
+    throttle_classes = [IPThrottle, AccountThrottle]
+    throttle_scope = 'signup'
+    throttle_account_field = 'email'
     serializer_class = UserSerializer
     
     def post(self, request, *args, **kwargs):
@@ -66,7 +100,7 @@ class SignupView(generics.CreateAPIView):
         }, status=status.HTTP_201_CREATED)
         
 
-class LoginView(APIView):
+class LoginView(AccountThrottleMixin, APIView):
     """
     Login for a user.
     
@@ -83,9 +117,13 @@ class LoginView(APIView):
     - 200: User logged in successfully
     - 400: Bad request with error message
     - 403: If user is inactive (not approved)
+    - 429: Too many attempts from this address or failed attempts for this account
     """
     
     permission_classes = (permissions.AllowAny,)
+    throttle_classes = [IPThrottle, AccountThrottle]
+    throttle_scope = 'login'
+    throttle_account_field = 'email'
     
     def post(self, request):
         try:
@@ -152,7 +190,7 @@ class LogoutView(APIView):
     def post(self, request):
         try:
             refresh_token = request.data.get('refresh')
-            token = RefreshToken(refresh_token)
+            token = FilteredRefreshToken(refresh_token)
             token.blacklist()
         except Exception as e:
             logger.exception("Error occurred in Exception", extra={'data': {str(e)}})
@@ -183,9 +221,16 @@ class SecureTokenRefreshView(TokenRefreshView):
     - 205: User logged out successfully
     - 400: Bad request with error message
     - 403: If user is inactive (not approved)
+    - 429: Too many refreshes from this address
+
+    Blacklisted tokens are detected through a per-worker Bloom filter, so
+    refreshing a valid token does not query the blacklist tables.
     """
     
     permission_classes = [permissions.AllowAny]
+    throttle_classes = [IPThrottle]
+    throttle_scope = 'token_refresh'
+    serializer_class = SecureTokenRefreshSerializer
 
     def post(self, request, *args, **kwargs):
         user_agent = request.META.get('HTTP_USER_AGENT', '')
@@ -201,36 +246,176 @@ class SecureTokenRefreshView(TokenRefreshView):
 
         try:
             serializer.is_valid(raise_exception=True)
-        except InvalidToken:
+        except (InvalidToken, TokenError):
             logger.exception('Invalid Token', extra={'data': refresh_token})
             return Response({'detail': 'Invalid or expired token.'}, status=status.HTTP_401_UNAUTHORIZED)
 
         return Response(serializer.validated_data, status=status.HTTP_200_OK)
         
 
-class ListAllProductsView(generics.ListAPIView):
+class ListAllProductsView(CatalogCacheMixin, generics.ListAPIView):
     """
     Retrieve a list of all active products with ratings for the authenticated user.
 
     This endpoint allows an authenticated user to view all products that are active.
     Each product includes its average rating and total rating count.
+    Rendered pages are served from the catalog cache, keyed by the catalog's state.
 
     Permissions:
     - Requires the user to be authenticated.
 
     HTTP Method:
-    - GET: Returns a list of products.
+    - GET: Returns a page of products.
+
+    Query Parameters:
+    - cursor (str): Opaque cursor taken from the `next`/`previous` links.
+    - page_size (int): Number of products per page (max 100).
+    - ordering (str): One of `newest`, `oldest`, `price`, `-price`, `rating`.
 
     Responses:
-    - 200: Successfully retrieved the list of products.
+    - 200: Successfully retrieved a page of products.
+    - 304: Not modified since the client's `If-None-Match`/`If-Modified-Since`.
     - 403: If the user is not authenticated or inactive.
     """
     serializer_class = ProductSerializer
     permission_classes = [permissions.IsAuthenticated]  
-    queryset = Product.objects.active().with_ratings()
+    pagination_class = ProductPagination
+    queryset = Product.objects.active()
+
+    @conditional_get
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
 
 
-class ListAllCartsView(generics.ListAPIView):
+class ProductSearchView(CatalogCacheMixin, generics.ListAPIView):
+    """
+    Full-text search over active products.
+
+    Matches the query against product names and descriptions, with name matches
+    ranked above description matches. Backed by the GIN indexed `search_vector`
+    column on PostgreSQL.
+
+    Permissions:
+    - Requires the user to be authenticated.
+
+    HTTP Method:
+    - GET: Returns a ranked page of matching products.
+
+    Query Parameters:
+    - q (str): Search text, e.g. `red shoes` or `"running shoe" -trail`. (required)
+    - page (int): Page number.
+    - page_size (int): Number of products per page (max 100).
+
+    Responses:
+    - 200: Successfully retrieved matching products, best match first.
+    - 304: Not modified since the client's `If-None-Match`/`If-Modified-Since`.
+    - 400: Missing search query.
+    - 403: If the user is not authenticated or inactive.
+    """
+    serializer_class = ProductSearchSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    pagination_class = SearchPagination
+
+    def get_queryset(self):
+        return search_products(Product.objects.active(), self.request.query_params.get('q', '').strip())
+
+    def list(self, request, *args, **kwargs):
+        if not request.query_params.get('q', '').strip():
+            logger.warning("Search query missing")
+            return Response({'error': 'Search query is required.'}, status=status.HTTP_400_BAD_REQUEST)
+        return super().list(request, *args, **kwargs)
+
+    @conditional_get
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
+
+class RecommendationMixin:
+    """Shared `limit` handling for the "frequently bought together" views."""
+
+    MAX_RECOMMENDATIONS = 20
+
+    def get_limit(self, request):
+        try:
+            limit = int(request.query_params.get('limit', 10))
+        except ValueError:
+            raise ValidationError({'limit': "Limit must be an integer."})
+        if not 1 <= limit <= self.MAX_RECOMMENDATIONS:
+            raise ValidationError({'limit': f"Limit must be between 1 and {self.MAX_RECOMMENDATIONS}."})
+        return limit
+
+
+class ProductRecommendationsView(RecommendationMixin, APIView):
+    """
+    Retrieve products frequently bought together with a product.
+
+    Recommendations are rebuilt offline from order history by the
+    `build_recommendations` command and read here with a single indexed query.
+
+    Permissions:
+    - Requires the user to be authenticated.
+
+    HTTP Method:
+    - GET: Returns the recommended products, best first.
+
+    Query Parameters:
+    - limit (int): Number of products to return (1-20, default 10).
+
+    Responses:
+    - 200: `{"product_id", "recommendations": [...]}`; empty if the product has no order history yet.
+    - 400: Invalid limit.
+    - 403: If the user is not authenticated or inactive.
+    - 404: If the product does not exist or is deleted.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, pk):
+        limit = self.get_limit(request)
+        if not Product.objects.active().filter(pk=pk).exists():
+            return Response({'error': 'Product not found.'}, status=status.HTTP_404_NOT_FOUND)
+
+        products = list(recommended_products([pk], limit=limit))
+
+        return Response({
+            'product_id': pk,
+            'recommendations': ProductSerializer(products, many=True).data
+        }, status=status.HTTP_200_OK)
+
+
+class CartRecommendationsView(RecommendationMixin, APIView):
+    """
+    Retrieve products frequently bought together with the items in the user's cart.
+
+    Scores of products recommended for several cart items are added up, and
+    products already in the cart are left out. The cart is read as a subquery of
+    the same single indexed query.
+
+    Permissions:
+    - Requires the user to be authenticated.
+
+    HTTP Method:
+    - GET: Returns the recommended products, best first.
+
+    Query Parameters:
+    - limit (int): Number of products to return (1-20, default 10).
+
+    Responses:
+    - 200: `{"recommendations": [...]}`; empty for an empty cart.
+    - 400: Invalid limit.
+    - 403: If the user is not authenticated or inactive.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        in_cart = CartItem.objects.filter(cart__user=request.user).values('product_id')
+        products = recommended_products(in_cart, limit=self.get_limit(request))
+
+        return Response({
+            'recommendations': ProductSerializer(products, many=True).data
+        }, status=status.HTTP_200_OK)
+
+
+class ListAllCartsView(CartValidatorMixin, generics.ListAPIView):
     """
     Retrieve the authenticated user's cart(s) with items and product details.
 
@@ -248,6 +433,7 @@ class ListAllCartsView(generics.ListAPIView):
 
     Responses:
     - 200: Successfully retrieved cart(s).
+    - 304: Cart unchanged since the client's `If-None-Match`/`If-Modified-Since`.
     - 403: Forbidden if the user is not authenticated.
     """
     
@@ -258,6 +444,10 @@ class ListAllCartsView(generics.ListAPIView):
     def get_queryset(self):
         return Cart.objects.filter(user=self.request.user) 
 
+    @conditional_get
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
 
 class AddToCartView(generics.GenericAPIView):
     """
@@ -265,6 +455,8 @@ class AddToCartView(generics.GenericAPIView):
 
     Allows an authenticated user to add a product to their cart.
     If the product already exists in the cart, the quantity will be updated.
+    The add is a single upsert, so concurrent requests (double clicks) for the
+    same product never lose an increment or create duplicate cart rows.
 
     Permissions:
     - Requires the user to be authenticated.
@@ -277,8 +469,8 @@ class AddToCartView(generics.GenericAPIView):
     - quantity (int): Quantity to add. Defaults to 1 if not provided.
 
     Responses:
-    - 200: Product added or updated successfully in the cart.
-    - 400: Missing or invalid product ID.
+    - 200: Product added or updated successfully, returns the changed cart item.
+    - 400: Missing or invalid product ID or quantity.
     - 404: Product not found.
     - 403: Forbidden if the user is not authenticated.
     """
@@ -295,21 +487,28 @@ class AddToCartView(generics.GenericAPIView):
             return Response({'error': 'Product ID is required.'}, status=status.HTTP_400_BAD_REQUEST)
 
         try:
-            product = Product.objects.get(id=product_id)
-        except Product.DoesNotExist:
-            
-            logger.error('Product Not Found', extra={'data': f'Product ID : {product_id}'})
-            return Response({'error': 'Product not found.'}, status=status.HTTP_404_NOT_FOUND)
+            product_id = int(product_id)
+            quantity = int(quantity)
+        except (TypeError, ValueError):
+            logger.error("ValueError - Product ID or quantity is not in integer format")
+            return Response({'error': 'Invalid product ID or quantity.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        if quantity < 1:
+            logger.warning("Quantity must be positive", extra={'data': quantity})
+            return Response({'error': 'Quantity must be at least 1.'}, status=status.HTTP_400_BAD_REQUEST)
 
         cart, created = Cart.objects.get_or_create(user=request.user)
+        added = CartItem.objects.add_products(cart, {product_id: quantity})
 
-        cart_item, created = CartItem.objects.get_or_create(cart=cart, product=product)
-        if not created:
-            cart_item.quantity += int(quantity)
-            cart_item.save()
+        if product_id not in added:
+            logger.error('Product Not Found', extra={'data': f'Product ID : {product_id}'})
+            return Response({'error': 'Product not found.'}, status=status.HTTP_404_NOT_FOUND)
 
-        serializer = CartSerializer(cart)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        item_id, item_quantity = added[product_id]
+        return Response({
+            'cart_id': cart.id,
+            'item': {'id': item_id, 'product_id': product_id, 'quantity': item_quantity},
+        }, status=status.HTTP_200_OK)
     
 
 class UpdateCartItemView(generics.UpdateAPIView):
@@ -358,9 +557,9 @@ class UpdateCartItemView(generics.UpdateAPIView):
             logger.error("ValueError - Quantity is not in integer format")
             return Response({'error': 'Invalid quantity.'}, status=status.HTTP_400_BAD_REQUEST)
         
-        if quantity > 10:
+        if quantity > CartItem.MAX_QUANTITY:
             logger.warning("Quantity exceeded the limit")
-            return Response({'error': 'Max 10 quantity allowed.'}, status=status.HTTP_400_BAD_REQUEST)
+            return Response({'error': f'Max {CartItem.MAX_QUANTITY} quantity allowed.'}, status=status.HTTP_400_BAD_REQUEST)
         
         item.quantity = quantity
         item.save()
@@ -403,6 +602,51 @@ class RemoveCartItemView(generics.DestroyAPIView):
         return Response({'message': 'Item removed from cart.'}, status=status.HTTP_204_NO_CONTENT)
     
     
+class CartBatchView(generics.GenericAPIView):
+    """
+    Apply several cart changes in one request.
+
+    Allows an authenticated user to add, set or remove any number of cart items
+    at once. All operations are applied in a single transaction: either every
+    change is saved or, on any error, none are. Items are addressed by product,
+    so no per-item ownership lookups are needed.
+
+    Permissions:
+    - Requires the user to be authenticated.
+
+    HTTP Method:
+    - POST: Apply a batch of cart operations.
+
+    Request Body (JSON):
+    - operations (list, required, max 50), each with:
+      - op (str): `add` (increase quantity), `set` (replace quantity) or `remove`.
+      - product_id (int): ID of the product.
+      - quantity (int): Required for `add` and `set`, between 1 and 10.
+
+    Responses:
+    - 200: Operations applied, returns the resulting cart lines and totals.
+    - 400: Invalid operations, unknown products, or a quantity above 10.
+    - 403: Forbidden if the user is not authenticated.
+    """
+
+    serializer_class = CartBatchSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        cart, created = Cart.objects.get_or_create(user=request.user)
+        try:
+            CartItem.objects.apply_operations(cart, serializer.validated_data['operations'])
+        except DjangoValidationError as e:
+            logger.warning("Cart batch rejected", extra={'data': e.messages})
+            return Response({'error': e.messages[0]}, status=status.HTTP_400_BAD_REQUEST)
+
+        summary = get_checkout_summary(request.user)
+        return Response(CheckoutSummarySerializer(summary).data, status=status.HTTP_200_OK)
+
+
 class AddressListCreateView(generics.ListCreateAPIView):
     """
     List and create shipping addresses for the authenticated user.
@@ -490,12 +734,13 @@ class AddressSelectView(generics.UpdateAPIView):
         return Response(serializer.data, status=status.HTTP_200_OK)
     
     
-class CheckoutView(APIView):
+class CheckoutView(CartValidatorMixin, APIView):
     """
     Retrieve the current user's cart items and calculate the total price.
 
     This endpoint allows an authenticated user to view all items currently in their cart,
     along with the computed total cost based on product price and quantity.
+    Line totals, item count and grand total come from a single database query.
 
     Permissions:
     - Requires the user to be authenticated.
@@ -505,27 +750,16 @@ class CheckoutView(APIView):
 
     Responses:
     - 200: Successfully retrieved cart items and total price.
+    - 304: Cart unchanged since the client's `If-None-Match`/`If-Modified-Since`.
     - 403: Unauthorized if the user is not authenticated.
     """
     
     permission_classes = [permissions.IsAuthenticated]
 
+    @conditional_get
     def get(self, request):
-        try:
-            cart = Cart.objects.prefetch_related('items__product').get(user=request.user)
-            serializer = CartSerializer(cart)
-            total_price = sum(item.quantity * item.product.price for item in cart.get_cart_items())
-
-            return Response({
-                'cart_items': serializer.data['items'],
-                'total_price': total_price
-            })
-        except Cart.DoesNotExist:
-            logger.warning("DoesNotExist - Current user(s) cart not exist", extra={'data': request.user})
-            return Response({
-                'cart_items': [],
-                'total_price': 0
-            })
+        summary = get_checkout_summary(request.user)
+        return Response(CheckoutSummarySerializer(summary).data)
 
 
 class PlaceOrderView(APIView):
@@ -533,7 +767,8 @@ class PlaceOrderView(APIView):
     Place an order from the user's cart.
 
     This endpoint allows an authenticated user to place an order using a selected address.
-    It creates an order record with all cart items, calculates the total amount, and clears the cart.
+    It creates an order record with all cart items, calculates the total amount, takes the
+    ordered units out of stock (for products with tracked stock), and clears the cart.
 
     Permissions:
     - Requires the user to be authenticated.
@@ -541,19 +776,26 @@ class PlaceOrderView(APIView):
     HTTP Method:
     - POST: Submit an order request.
 
+    Request Headers:
+    - Idempotency-Key (optional): Client-generated unique key for this checkout. Retries
+      with the same key return the original response instead of placing another order.
+
     Request Body:
     - address_id (int): ID of the user's address to associate with the order.
 
     Responses:
-    - 201: Order placed successfully.
+    - 201: Order placed successfully (or replayed, with `Idempotent-Replayed: true`).
     - 400: Missing address ID, empty cart, or other validation error.
     - 403: If the user is not authenticated.
-    - 404: Address or cart not found.
+    - 404: Address not found.
+    - 409: A product in the cart is out of stock; nothing is ordered.
+    - 422: Idempotency-Key was already used with a different request body.
     - 500: Database transaction failed.
     """
     
     permission_classes = [permissions.IsAuthenticated]
 
+    @idempotent('place-order')
     def post(self, request):
         address_id = request.data.get('address_id')
 
@@ -568,40 +810,43 @@ class PlaceOrderView(APIView):
             return Response({'detail': 'Address not found.'}, status=status.HTTP_404_NOT_FOUND)
         
         try:
-            cart = Cart.objects.prefetch_related('items__product').get(user=request.user)
-            cart_items = cart.get_cart_items()
+            with transaction.atomic():
+                summary = get_checkout_summary(request.user)
 
-            if not cart_items.exists():
-                logger.warning("Cart is empty", extra={'data': cart})
-                return Response({'detail': 'Cart is empty.'}, status=status.HTTP_400_BAD_REQUEST)
+                if not summary['items']:
+                    logger.warning("Cart is empty", extra={'data': request.user})
+                    return Response({'detail': 'Cart is empty.'}, status=status.HTTP_400_BAD_REQUEST)
 
-            with transaction.atomic():
                 order = Order.objects.create(
                     user=request.user,
                     address=address,
                     status='approved',
-                    total_amount=0 
+                    total_amount=summary['total'],
+                    items_count=len(summary['items'])
                 )
 
-                total = 0
-                order_items = []
-                
-                for item in cart_items:
-                    order_item = OrderItem(
+                OrderItem.objects.bulk_create([
+                    OrderItem(
                         order=order,
                         product=item.product,
                         quantity=item.quantity,
-                        price=item.product.price
+                        price=item.product.price,
+                        created_at=order.created_at
                     )
-                    total += item.quantity * item.product.price
-                    order_items.append(order_item)
-            
-                OrderItem.objects.bulk_create(order_items)
+                    for item in summary['items']
+                ])
+
+                CartItem.objects.filter(pk__in=[item.pk for item in summary['items']]).delete()
 
-                order.total_amount = total
-                order.save()
+                # Sent by the worker once this transaction commits; dropped with it on rollback.
+                enqueue('order_confirmation_email', {'order_id': order.id})
+                enqueue('record_order_buyers', {'order_id': order.id})
 
-                cart.items.all().delete()
+                # Last, so the rollup and stock row locks are held for as little time as possible.
+                record_order_sales(order, [
+                    (item.product_id, item.quantity, item.product.price) for item in summary['items']
+                ])
+                reserve({item.product_id: item.quantity for item in summary['items']})
                 
                 logger.info(f"Order {order.id} created successfully for user {request.user.username}")
 
@@ -612,10 +857,13 @@ class PlaceOrderView(APIView):
                 'order': serialized_order.data
             }, status=status.HTTP_201_CREATED)
 
-        except Cart.DoesNotExist:
-            logger.warning("Cart not found for user", extra={'data': request.user})
-            return Response({'detail': 'Cart not found.'}, status=status.HTTP_404_NOT_FOUND)
-        
+        except InsufficientStock as e:
+            logger.info(f"Order for user {request.user.username} rejected: {e}")
+            return Response({
+                'detail': 'Some items in your cart are out of stock.',
+                'product_id': e.product_id
+            }, status=status.HTTP_409_CONFLICT)
+
         except Exception as e:
             logger.error(f"Error placing order for user {request.user.username}: {str(e)}")
             return Response({
@@ -623,39 +871,76 @@ class PlaceOrderView(APIView):
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
         
 
-class OrderListView(APIView):
+class OrderListView(generics.ListAPIView):
     """
-    Retrieve all orders placed by the authenticated user.
+    Retrieve the orders placed by the authenticated user, newest first.
+
+    Allows an authenticated user to page through their previous orders, including
+    associated products, quantities, delivery addresses and their own rating of
+    each product. Results are keyset paginated; follow `next` to load older orders.
 
-    Allows an authenticated user to view a list of all their previous orders, including
-    associated products, quantities, and delivery addresses.
+    The user's ratings for every product on the page are resolved in a single query,
+    so the number of queries per page is constant regardless of how many orders or
+    items it contains.
 
     Permissions:
     - Requires the user to be authenticated.
 
     HTTP Method:
-    - GET: Fetch list of user orders.
+    - GET: Fetch a page of user orders.
+
+    Query Parameters:
+    - cursor (optional): Opaque cursor taken from a previous `next`/`previous` link.
 
     Request Body:
     - None
 
     Responses:
-    - 200: Returns a list of orders with related order items and address details.
+    - 200: `{"next", "previous", "results"}` with orders, order items and address details.
+    - 304: Orders unchanged since the client's `If-None-Match`/`If-Modified-Since`.
     - 401: If the user is not authenticated.
     """
     
     permission_classes = [permissions.IsAuthenticated]
-    
-    def get(self, request):
-        orders = Order.objects.filter(user=request.user) \
+    serializer_class = OrderSerializer
+    pagination_class = OrderPagination
+
+    def get_validator_state(self, request):
+        orders = Order.objects.filter(user=request.user).aggregate(
+            orders_modified=Max('updated_at'),
+            products_modified=Max('items__product__updated_at'),
+            count=Count('id', distinct=True),
+        )
+        ratings = Rating.objects.filter(user=request.user).aggregate(
+            ratings_modified=Max('updated_at'),
+            count=Count('id'),
+        )
+        return (orders['orders_modified'], orders['products_modified'], orders['count'],
+                ratings['ratings_modified'], ratings['count'])
+
+    def get_queryset(self):
+        return Order.objects.filter(user=self.request.user) \
             .select_related('address') \
             .prefetch_related(
-                'items__product',
-            ) \
-            .order_by('-created_at')
+                Prefetch('items', queryset=OrderItem.objects.select_related('product')),
+            )
 
-        serializer = OrderSerializer(orders, many=True, context={'user': request.user})
-        return Response({"orders": serializer.data}, status=status.HTTP_200_OK)
+    def list(self, request, *args, **kwargs):
+        page = self.paginate_queryset(self.get_queryset())
+        product_ids = {item.product_id for order in page for item in order.items.all()}
+        ratings = dict(
+            Rating.objects.filter(user=request.user, product_id__in=product_ids)
+            .values_list('product_id', 'score')
+        )
+
+        context = self.get_serializer_context()
+        context['ratings'] = ratings
+        serializer = self.get_serializer(page, many=True, context=context)
+        return self.get_paginated_response(serializer.data)
+    
+    @conditional_get
+    def get(self, request, *args, **kwargs):
+        return self.list(request, *args, **kwargs)
 
 
 class RatingSubmitView(APIView):
@@ -709,7 +994,7 @@ class RatingSubmitView(APIView):
             logger.error("Rating type is not in the required format")
             return Response({"error": "Invalid rating value"}, status=status.HTTP_400_BAD_REQUEST)
 
-        Rating.objects.create(product=order_item.product, user=request.user, score=rating_score)
+        order_item.product.add_rating(request.user, rating_score)
         return Response({"message": "Rating submitted successfully"}, status=status.HTTP_201_CREATED)
 
 
@@ -15,6 +15,7 @@ import os
 from dotenv import load_dotenv
 import dj_database_url
 import cloudinary, cloudinary.uploader, cloudinary.api
+from corsheaders.defaults import default_headers
 
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -61,12 +62,27 @@ INSTALLED_APPS = [
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'core_app.authentication.CachedJWTAuthentication',
         # 'rest_framework.authentication.SessionAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    # Login, signup and token refresh limits, see core_app.throttling.
+    'DEFAULT_THROTTLE_RATES': {
+        'login_ip': os.getenv('THROTTLE_LOGIN_IP', '20/min'),
+        'login_account': os.getenv('THROTTLE_LOGIN_ACCOUNT', '10/hour'),
+        'admin_login_ip': os.getenv('THROTTLE_ADMIN_LOGIN_IP', '10/min'),
+        'admin_login_account': os.getenv('THROTTLE_ADMIN_LOGIN_ACCOUNT', '5/hour'),
+        'signup_ip': os.getenv('THROTTLE_SIGNUP_IP', '10/hour'),
+        'signup_account': os.getenv('THROTTLE_SIGNUP_ACCOUNT', '3/hour'),
+        'token_refresh_ip': os.getenv('THROTTLE_TOKEN_REFRESH_IP', '60/min'),
+    },
+    # Number of trusted proxies in front of the app. With 0 the client address
+    # is REMOTE_ADDR and X-Forwarded-For, which clients can forge, is ignored;
+    # behind a load balancer set it to the real proxy count, or every client
+    # shares the proxy's address and its per-IP limits.
+    'NUM_PROXIES': int(os.getenv('NUM_PROXIES', '0')),
 }
 
 
@@ -85,6 +101,7 @@ MIDDLEWARE = [
 CORS_ALLOW_ALL_ORIGINS = False
 CORS_ALLOWED_ORIGINS = os.getenv('CORS_ALLOWED_ORIGINS', '').split(',')
 CORS_ALLOW_CREDENTIALS = True
+CORS_ALLOW_HEADERS = (*default_headers, 'idempotency-key')
 
 SECURE_SSL_REDIRECT = None
 SESSION_COOKIE_SECURE = None
@@ -215,6 +232,55 @@ CACHES = {
     }
 }
 
+# A cache shared by every worker, needed for cache invalidation, the auth
+# user cache and the rate limits to hold across processes.
+REDIS_URL = os.getenv('REDIS_URL')
+if REDIS_URL:
+    CACHES['default'] = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': REDIS_URL,
+    }
+
+# Rendered product list pages, see core_app.cache.CatalogCache.
+CATALOG_CACHE = {
+    'ALIAS': 'default',
+    'TIMEOUT': int(os.getenv('CATALOG_CACHE_TIMEOUT', 300)),
+}
+
+# Users loaded by JWT authentication, see core_app.authentication.UserCache.
+# Only used with a shared cache (REDIS_URL).
+AUTH_USER_CACHE = {
+    'ALIAS': 'default',
+    'TIMEOUT': int(os.getenv('AUTH_USER_CACHE_TIMEOUT', 60)),
+}
+
+# Seconds a stored Idempotency-Key response is replayed before it may be reused.
+IDEMPOTENCY_KEY_TTL = int(os.getenv('IDEMPOTENCY_KEY_TTL', 24 * 60 * 60))
+
+# Background job runner (core_app.jobs); all values in seconds.
+JOBS = {
+    'POLL_INTERVAL': float(os.getenv('JOBS_POLL_INTERVAL', 1)),
+    'LOCK_TIMEOUT': int(os.getenv('JOBS_LOCK_TIMEOUT', 300)),
+    'RETRY_BACKOFF': int(os.getenv('JOBS_RETRY_BACKOFF', 10)),
+    'MAX_RETRY_DELAY': int(os.getenv('JOBS_MAX_RETRY_DELAY', 60 * 60)),
+}
+
+# Throttle counters, see core_app.throttling. Use a shared cache in production
+# so the limits apply across workers.
+AUTH_THROTTLE = {
+    'ALIAS': os.getenv('AUTH_THROTTLE_CACHE', 'default'),
+}
+
+# Blacklisted refresh tokens, see core_app.tokens.
+TOKEN_BLACKLIST = {
+    'FILTER_SYNC_INTERVAL': float(os.getenv('TOKEN_BLACKLIST_FILTER_SYNC_INTERVAL', 5)),
+    'FILTER_REBUILD_INTERVAL': int(os.getenv('TOKEN_BLACKLIST_FILTER_REBUILD_INTERVAL', 300)),
+    'FILTER_ERROR_RATE': 0.001,
+    'FILTER_MIN_CAPACITY': 10000,
+    'SWEEP_INTERVAL': int(os.getenv('TOKEN_SWEEP_INTERVAL', 60 * 60)),
+    'SWEEP_CHUNK_SIZE': 1000,
+}
+
 # EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
 # EMAIL_HOST = "smtp.gmail.com"
 # EMAIL_USE_TLS = True